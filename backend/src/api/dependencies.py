@@ -3,24 +3,33 @@ Dependencies of the app, currently, auth_strategies to Argos
 """
 
 import os
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Annotated
+from fastapi import Depends, Request
 from backend.src.crud.crud_thanos_app import CrudThanosApp
-from backend.src.core.yaml_config_loader import config
+from backend.src.core.yaml_config_loader import get_config
 from backend.src.crud.auth_strategies.aad_auth import AAD
 from backend.src.crud.auth_strategies.none_auth import NoAuth
+from backend.src.utils.helpers import validate_query_parameters
 
+# Use NoAuth during testing to avoid real HTTP requests to Azure AD
+IS_TEST_ENV = os.getenv("TEST_ENV", "False").lower() in ("true", "1", "t")
 
-def get_app_dao() -> CrudThanosApp | None:
+
+@lru_cache(maxsize=1)
+def shared_app_dao() -> CrudThanosApp | None:
     """
     Function to get an instance of CrudApp, which is a data access object (DAO).
+    The instance is built on first use and shared by the whole process.
 
     Returns:
         CrudThanosApp: An instance of CrudApp representing the data access object.
     """
-    api_config = config.carmen_api
+    api_config = get_config().carmen_api
     if not api_config:
         return
-    # Use NoAuth during testing to avoid real HTTP requests to Azure AD
-    if os.getenv("TEST_ENV", "False").lower() in ("true", "1", "t"):
+    if IS_TEST_ENV:
         return CrudThanosApp(api_config.thanos_url, NoAuth(), api_config.verify_ssl)
 
     if api_config.authentication == "azure":
@@ -30,5 +39,47 @@ def get_app_dao() -> CrudThanosApp | None:
     return CrudThanosApp(api_config.thanos_url, NoAuth(), api_config.verify_ssl)
 
 
-# AppDao = Annotated[CrudApp, Depends(get_app_dao)] DO: Apply this dependency function for a better practise
-AppDao = get_app_dao()
+async def get_app_dao() -> CrudThanosApp | None:
+    """
+    Dependency returning the shared CrudApp.
+
+    Declared async so that FastAPI returns the cached instance on the event loop
+    instead of dispatching a sync dependency to the threadpool.
+
+    Returns:
+        CrudThanosApp: An instance of CrudApp representing the data access object.
+    """
+    return shared_app_dao()
+
+
+AppDao = Annotated[CrudThanosApp, Depends(get_app_dao)]
+
+
+async def close_app_dao() -> None:
+    """
+    Close the HTTP connections of the shared CrudApp, if it was ever built.
+    """
+    if shared_app_dao.cache_info().currsize == 0:
+        return
+    app_dao = shared_app_dao()
+    if app_dao is not None:
+        await app_dao.aclose()
+
+
+def query_parameters_validator(
+    allowed_params: frozenset[str],
+) -> Callable[[Request], Awaitable[None]]:
+    """
+    Function to build a dependency rejecting the query parameters that are not allowed.
+
+    Args:
+        allowed_params: The query parameters accepted by the endpoint.
+
+    Returns:
+        Callable: The dependency to add to the endpoint's dependencies.
+    """
+
+    async def validate(request: Request) -> None:
+        validate_query_parameters(request, allowed_params)
+
+    return validate
@@ -11,12 +11,14 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Annotated
-from fastapi import Query, APIRouter
-from starlette.requests import Request
+from fastapi import Depends, Query, APIRouter
 
+from backend.src.api.dependencies import AppDao, query_parameters_validator
 from backend.src.common.enums import SamplingRate
 from backend.src.common.errors import ErrorCode
+from backend.src.crud.crud_thanos_app import CrudThanosApp
 from backend.src.common.known_exception import (
     DataFetchError,
     ValidationError,
@@ -27,8 +29,6 @@ from backend.src.schemas.pod import Pod
 from backend.src.schemas.compute_resource import ComputeResource
 from backend.src.services.carbon_service.carbon_service import CarbonService
 from backend.src.utils.helpers import (
-    convert_to_seconds,
-    validate_query_parameters,
     get_end_time,
     get_start_time,
 )
@@ -40,9 +40,45 @@ router = APIRouter()
 
 logger = logging.getLogger(__name__)
 
+RUN_ENGINE_ALLOWED_PARAMS = frozenset(
+    {
+        "start_date",
+        "end_date",
+        "sampling_rate",
+        "start-date",
+        "end-date",
+        "sampling",
+        "selected_apps",
+        "app",
+        "paas",
+        "namespace",
+        "emission_breakdown",
+    }
+)
+
+
+@lru_cache(maxsize=1)
+def _argos_service(app_dao: CrudThanosApp) -> ArgosService:
+    """Builds the ArgosService once per Thanos DAO."""
+    return ArgosService(app_dao)
+
+
+async def get_argos_service(app_dao: AppDao) -> ArgosService:
+    """
+    Function to get the ArgosService shared by the endpoints of the process.
+
+    Returns:
+        ArgosService: The service instance bound to the injected Thanos DAO.
+    """
+    return _argos_service(app_dao)
+
+
+ArgosServiceDep = Annotated[ArgosService, Depends(get_argos_service)]
+
 
 @router.get("/", summary="Returns available paas, app or namespace values")
 async def get_available_resources(
+    argos_service: ArgosServiceDep,
     selected_apps: Annotated[
         list[str] | None,
         Query(
@@ -66,6 +102,10 @@ async def get_available_resources(
     """
     Retrieves a dictionary of available resources (paas, app or namespace).
 
+    Args:
+
+        argos_service (ArgosService): The Thanos service injected by FastAPI.
+
     Returns:
 
         Dict[str, List[str]]: key as the resource type and value as the list of available resources.
@@ -80,7 +120,7 @@ async def get_available_resources(
             selected_apps,
             paas,
         )
-        return await ArgosService().get_available_resources(selected_apps, paas)
+        return await argos_service.get_available_resources(selected_apps, paas)
     except (DataFetchError, ValidationError):
         raise
     except Exception as e:
@@ -100,9 +140,11 @@ async def get_available_resources(
         "the extracted data (CPU, memory, etc.)"
     ),
     response_model=list[ComputeResource] | dict[str, dict[str, dict[str, list[Pod]]]],
+    response_model_exclude_none=True,
+    dependencies=[Depends(query_parameters_validator(RUN_ENGINE_ALLOWED_PARAMS))],
 )
 async def run_engine_for_selected_resources(
-    request: Request,
+    argos_service: ArgosServiceDep,
     start_date: Annotated[
         datetime | None,
         Query(
@@ -173,7 +215,7 @@ async def run_engine_for_selected_resources(
 
     Args:
 
-        request (Request): The incoming request.
+        argos_service (ArgosService): The Thanos service injected by FastAPI.
 
         start_date (datetime, optional): Starting time for the engine.
 
@@ -196,26 +238,6 @@ async def run_engine_for_selected_resources(
         Dict[str, Dict[str, Dict[str, List[Pod]]]]: Computed data for each pod of selected cluster, app and namespace
         at pod level.
     """
-    # Validate query parameters
-    allowed_params = {
-        "start_date",
-        "end_date",
-        "sampling_rate",
-        "start-date",
-        "end-date",
-        "sampling",
-        "selected_apps",
-        "app",
-        "paas",
-        "namespace",
-        "emission_breakdown",
-    }
-
-    try:
-        validate_query_parameters(request, allowed_params)
-    except ValidationError:
-        raise
-
     # Validate date range
     if start_date and end_date and start_date >= end_date:
         logger.error(
@@ -241,7 +263,7 @@ async def run_engine_for_selected_resources(
         # Retrieve telemetry data
         compute_resources: list[
             ComputeResource
-        ] = await ArgosService().retrieve_telemetry_data(
+        ] = await argos_service.retrieve_telemetry_data(
             start_date, end_date, sampling_rate, paas, selected_apps, namespace
         )
 
@@ -250,7 +272,7 @@ async def run_engine_for_selected_resources(
             return []
 
         # Convert sampling rate and run carbon engine
-        step_seconds = convert_to_seconds(sampling_rate.value)
+        step_seconds = sampling_rate.seconds
         # ioc_key is embedded for now, it will be included to the request in the future for the model selection
         carbon_service = ioc_util.resolve(CarbonService, "IFApp", step_seconds)
 
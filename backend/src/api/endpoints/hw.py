@@ -5,26 +5,35 @@ API module handling router of the hardware endpoints.
 from __future__ import annotations
 
 from typing import Annotated
-from fastapi import APIRouter, Query, HTTPException
-from starlette.requests import Request
+import numpy as np
+from fastapi import APIRouter, Depends, Query, HTTPException
+from starlette.concurrency import run_in_threadpool
+from backend.src.api.dependencies import query_parameters_validator
 from backend.src.schemas.response_models import HardwareResponse
 from backend.src.schemas.virtual_machine import VirtualMachine
 from backend.src.services.carbon_service.carbon_service import CarbonService
 from backend.src.utils import ioc_util
-from backend.src.utils.helpers import validate_query_parameters
 from backend.src.utils.paas_ci_mapper import PaasCiMapper
 from backend.src.schemas.compute_resource import ComputeResource
 
 router = APIRouter()
 
+HARDWARE_ALLOWED_PARAMS = frozenset(
+    {"duration", "cpu-load", "storage-size", "virtual_machine-type"}
+)
+
+# The hardware endpoint is not region aware yet, the carbon intensity is mocked
+# with the germanywestcentral value and resolved once per process
+_MOCKED_CARBON_INTENSITY = PaasCiMapper.calculate_ci("germanywestcentral")
+
 
 @router.get(
     "/run-engine-hardware/",
     summary="Returns the computed data (such as kWh, gCO2, etc.) for the selected VM type and CPU utilization.",
     response_model=list[HardwareResponse],
+    dependencies=[Depends(query_parameters_validator(HARDWARE_ALLOWED_PARAMS))],
 )
 async def run_engine_for_selected_hardware(
-    request: Request,
     vm_type: Annotated[
         str | None,
         Query(
@@ -64,8 +73,6 @@ async def run_engine_for_selected_hardware(
 
     Args:
 
-        request (Request): The incoming request.
-
         duration (str, optional): Duration for the engine.
 
         cpu_load (List[float]): CPU load for the selected VM type.
@@ -76,28 +83,34 @@ async def run_engine_for_selected_hardware(
 
         HardwareResponse: Computed data based on hardware inputs.
     """
-    allowed_params = {
-        "duration",
-        "cpu-load",
-        "storage-size",
-        "virtual_machine-type",
-    }
-    validate_query_parameters(request, allowed_params)
-
-    # Check if cpu load and storage size are the same length
-    if len(cpu_load) != len(storage_size):
+    # Reject invalid inputs before running the engine
+    cpu_load_array = np.asarray(cpu_load)
+    storage_size_array = np.asarray(storage_size)
+    if cpu_load_array.shape != storage_size_array.shape:
         raise HTTPException(
             status_code=400,
             detail="CPU load and storage size arrays must have the same length.",
         )
+    # NaN compares False to everything, so it is rejected explicitly
+    if (
+        not np.isfinite(cpu_load_array).all()
+        or ((cpu_load_array < 0) | (cpu_load_array > 100)).any()
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail="CPU load values must be between 0 and 100.",
+        )
+    if not np.isfinite(storage_size_array).all() or (storage_size_array < 0).any():
+        raise HTTPException(
+            status_code=400,
+            detail="Storage size values must not be negative, NaN or infinite.",
+        )
 
     # Compute the sampling rate(step_seconds)
     num_of_data_points = len(cpu_load)
     step_seconds = round(duration / num_of_data_points)
 
-    time_points = []
-    for i in range(num_of_data_points):
-        time_points.append(str(i * step_seconds))
+    time_points = (np.arange(num_of_data_points) * step_seconds).astype(str).tolist()
 
     # input for run_engine()
     vms = [
@@ -107,11 +120,11 @@ async def run_engine_for_selected_hardware(
             cpu_util=cpu_load,
             storage_size=storage_size,
             time_points=time_points,
-            carbon_intensity=PaasCiMapper.calculate_ci(
-                "germanywestcentral"
-            ),  # mocked for now
+            carbon_intensity=_MOCKED_CARBON_INTENSITY,
         )
     ]
 
     carbon_service = ioc_util.resolve(CarbonService, "IFVm", duration)
-    return carbon_service.run_engine(vms)
+    # IFVMService.run_engine is synchronous (template rendering + IF subprocess),
+    # run it in the threadpool so it does not block the event loop
+    return await run_in_threadpool(carbon_service.run_engine, vms)
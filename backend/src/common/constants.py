@@ -15,16 +15,7 @@ MEMORY_ELECTRICITY_RATIO_AZURE = 0.392  # watt per GB
 CARBON_INTENSITY_EUROPE = 281  # gCO2 per kWh
 CPU_THRESHOLD: int = 1000000  # 1.000.000 cores
 MEMORY_THRESHOLD: int = 100000000000000  # 100.000 TB
-RATE_TO_DURATION = {
-    SamplingRate.FIFTEEN_SECONDS: timedelta(seconds=15),
-    SamplingRate.THIRTY_SECONDS: timedelta(seconds=30),
-    SamplingRate.ONE_MINUTE: timedelta(minutes=1),
-    SamplingRate.FIVE_MINUTES: timedelta(minutes=5),
-    SamplingRate.THIRTY_MINUTES: timedelta(minutes=30),
-    SamplingRate.ONE_HOUR: timedelta(hours=1),
-    SamplingRate.SIX_HOURS: timedelta(hours=6),
-    SamplingRate.ONE_DAY: timedelta(days=1),
-}
+RATE_TO_DURATION = {rate: timedelta(seconds=rate.seconds) for rate in SamplingRate}
 
 IF_FILES_DIR = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
@@ -141,7 +132,7 @@ REGION_TO_COUNTRY_CARBON_INTENSITY = {
     "eastus": {"country": "Virginia", "carbon_intensity": 384},
     "eastus2": {"country": "Virginia", "carbon_intensity": 384},
     "francecentral": {"country": "France", "carbon_intensity": 44},
-    "francesouth": {"country": "France", "carbon": 44},
+    "francesouth": {"country": "France", "carbon_intensity": 44},
     "germanywestcentral": {"country": "Germany", "carbon_intensity": 344},
     "northcentralus": {"country": "Illinois", "carbon_intensity": 384},
     "northeurope": {"country": "Ireland", "carbon_intensity": 280},
@@ -154,59 +145,12 @@ REGION_TO_COUNTRY_CARBON_INTENSITY = {
     "westus2": {"country": "Washington", "carbon_intensity": 384},
     "centralindia": {"country": "India", "carbon_intensity": 708},
 }
-
-CARMEN_LOGO = """
-                                                        ##
-                                     ###                ###
-                                    ####                ####
-                                   #####                #####
-                                  #####                 ######
-                                 #####                 ########
-                                 ####                  ########
-                                #####                 ##########
-                               #####                  ##########
-                              #####                  ###########    #
-                             #####                   ############   ##
-                             ####                   #############    ##
-                            #####                  ##############    ##
-                           #####                  ################   ###
-                          #####                  #################   ####
-                         #####                  ############ #####   #####
-                         #####                  ############ #####    #####
-                        #####                  ############# #####     ####
-                        ####                   ############# #####     #####
-                       ####                   #############  ####       ####
-                       ####                   #############  ####       ####
-                       ####                   ############   ####       ####
-                       #####                  ############   ###        ####
-                        #####                  ##########    ###       #####
-                        #####                  ##########    ##       #####
-                         #####                 #########    ###      #####
-                          #####                 ########    ##      #####
-                           #####                 ######    ##      #####
-                            #####                %####    ##       #####
-                             ####%                ####            #####
-                             #####                ###            #####
-                              #####              ###            #####
-                               #####            ###            #####
-                                #####           ##             #####
-                                 #####                        #####
-                                 #####                       #####
-                                  #####                     #####
-                                   #####                   #####
-                                    ####                   ####
-                                     ###                    ###
-
-
-
-
-
-                         #####     ##     ######  ###   ###  ######  ###   #
-                        ##  ##    ####    ##  ##  ###   ###  ##      ###   #
-                        #%   ##   ####    ##  ##  ####  ###  ##      ####  #
-                       ##         # ##    ##  ##  #### ####  ######  ## ## #
-                       ##        ##  ##   #####   ## # ####  ######  ## ## #
-                        #    ##  ######   ## ##   ## ### ##  ##      ##  ###
-                        ### ##  ##   ##   ##  ##  ## ### ##  ##      ##  ###
-                         #####  ##    ##  ##  ##  ##  ## ##  ######  ##   ##
-"""
+# Flat views of the table above for the hot lookups
+REGION_CARBON_INTENSITY = {
+    region: values["carbon_intensity"]
+    for region, values in REGION_TO_COUNTRY_CARBON_INTENSITY.items()
+}
+REGION_COUNTRY = {
+    region: values["country"]
+    for region, values in REGION_TO_COUNTRY_CARBON_INTENSITY.items()
+}
@@ -4,7 +4,7 @@ This module defines custom Enum classes.
 
 from __future__ import annotations
 
-from enum import Enum
+from enum import Enum, StrEnum
 
 
 class LogLevel(Enum):
@@ -26,7 +26,7 @@ class LogLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
-class Label(Enum):
+class Label(StrEnum):
     """
     Enum for defining various thanos labels.
 
@@ -62,18 +62,27 @@ class HardwareConsumptionType(Enum):
     STORAGE_CAPACITY_BYTES = "storage capacity"
 
 
-class SamplingRate(str, Enum):
+class SamplingRate(StrEnum):
     """
     Enumeration representing different sampling rates.
 
-    Each sampling rate is defined as a string representing a duration.
+    Each sampling rate is defined as a string representing a duration,
+    its length in seconds is available through the seconds attribute.
     """
 
-    FIFTEEN_SECONDS = "15s"
-    THIRTY_SECONDS = "30s"
-    ONE_MINUTE = "1m"
-    FIVE_MINUTES = "5m"
-    THIRTY_MINUTES = "30m"
-    ONE_HOUR = "1h"
-    SIX_HOURS = "6h"
-    ONE_DAY = "1d"
+    seconds: int
+
+    def __new__(cls, value: str, seconds: int) -> SamplingRate:
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.seconds = seconds
+        return member
+
+    FIFTEEN_SECONDS = "15s", 15
+    THIRTY_SECONDS = "30s", 30
+    ONE_MINUTE = "1m", 60
+    FIVE_MINUTES = "5m", 300
+    THIRTY_MINUTES = "30m", 1800
+    ONE_HOUR = "1h", 3600
+    SIX_HOURS = "6h", 21600
+    ONE_DAY = "1d", 86400
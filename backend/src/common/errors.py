@@ -5,6 +5,7 @@ Error codes and templates for structured error handling across the application.
 from __future__ import annotations
 
 from enum import Enum
+from types import MappingProxyType
 
 
 class ErrorCategory(str, Enum):
@@ -137,6 +138,8 @@ class ErrorTemplate:
     Template for creating structured error messages.
     """
 
+    __slots__ = ("category", "message")
+
     def __init__(
         self,
         category: ErrorCategory,
@@ -145,292 +148,288 @@ class ErrorTemplate:
         self.category = category
         self.message = user_message
 
-    def to_string(self) -> str:
-        """
-        Converts the error template to its string representation.
-        """
-        return self.message
-
 
-ERRORS: dict[str, ErrorTemplate] = {
-    # Configuration errors
-    ErrorCode.CONFIG_MISSING_PARAMETERS: ErrorTemplate(
-        category=ErrorCategory.CONFIGURATION,
-        user_message="required parameters are missing: ",
-    ),
-    ErrorCode.CONFIG_FILE_MISSING: ErrorTemplate(
-        category=ErrorCategory.CONFIGURATION,
-        user_message="path provided for configuration was not found",
-    ),
-    ErrorCode.CONFIG_INVALID_FILE: ErrorTemplate(
-        category=ErrorCategory.CONFIGURATION,
-        user_message="configuration file is empty, invalid, or contains only comments",
-    ),
-    ErrorCode.CONFIG_INVALID_YAML: ErrorTemplate(
-        category=ErrorCategory.CONFIGURATION,
-        user_message="configuration file contains invalid YAML syntax",
-    ),
-    ErrorCode.CONFIG_INVALID_JSON: ErrorTemplate(
-        category=ErrorCategory.CONFIGURATION,
-        user_message="configuration file contains invalid JSON syntax",
-    ),
-    ErrorCode.CONFIG_INVALID_VALUE: ErrorTemplate(
-        category=ErrorCategory.CONFIGURATION,
-        user_message="configuration contains an invalid value",
-    ),
-    ErrorCode.CONFIG_VALIDATION_FAILED: ErrorTemplate(
-        category=ErrorCategory.CONFIGURATION,
-        user_message="configuration validation failed",
-    ),
-    # Authentication errors
-    ErrorCode.AUTH_TOKEN_EXPIRED: ErrorTemplate(
-        category=ErrorCategory.AUTHENTICATION,
-        user_message="authentication token has expired",
-    ),
-    ErrorCode.AUTH_TOKEN_INVALID: ErrorTemplate(
-        category=ErrorCategory.AUTHENTICATION,
-        user_message="authentication token is invalid",
-    ),
-    ErrorCode.AUTH_CREDENTIALS_MISSING: ErrorTemplate(
-        category=ErrorCategory.AUTHENTICATION,
-        user_message="authentication credentials are missing",
-    ),
-    ErrorCode.AUTH_CREDENTIALS_INVALID: ErrorTemplate(
-        category=ErrorCategory.AUTHENTICATION,
-        user_message="authentication credentials are invalid",
-    ),
-    ErrorCode.AUTH_TOKEN_REFRESH_FAILED: ErrorTemplate(
-        category=ErrorCategory.AUTHENTICATION,
-        user_message="failed to refresh authentication token after multiple attempts",
-    ),
-    ErrorCode.AUTH_UNAUTHORIZED: ErrorTemplate(
-        category=ErrorCategory.AUTHENTICATION,
-        user_message="unauthorized access - authentication required",
-    ),
-    # Data fetch errors
-    ErrorCode.DATA_FETCH_FAILED: ErrorTemplate(
-        category=ErrorCategory.DATA_FETCH,
-        user_message="failed to fetch data from the remote source",
-    ),
-    ErrorCode.DATA_FETCH_TIMEOUT: ErrorTemplate(
-        category=ErrorCategory.DATA_FETCH,
-        user_message="data fetch operation timed out",
-    ),
-    ErrorCode.DATA_FETCH_NO_RESULTS: ErrorTemplate(
-        category=ErrorCategory.DATA_FETCH,
-        user_message="no results returned from data source",
-    ),
-    ErrorCode.DATA_FETCH_INVALID_RESPONSE: ErrorTemplate(
-        category=ErrorCategory.DATA_FETCH,
-        user_message="received invalid response from data source",
-    ),
-    ErrorCode.DATA_FETCH_CONNECTION_ERROR: ErrorTemplate(
-        category=ErrorCategory.DATA_FETCH,
-        user_message="failed to establish connection to data source",
-    ),
-    ErrorCode.DATA_FETCH_QUERY_INVALID: ErrorTemplate(
-        category=ErrorCategory.DATA_FETCH,
-        user_message="query syntax is invalid",
-    ),
-    # Thanos/Prometheus errors
-    ErrorCode.THANOS_QUERY_FAILED: ErrorTemplate(
-        category=ErrorCategory.DATA_FETCH,
-        user_message="failed to execute thanos query",
-    ),
-    ErrorCode.THANOS_TIMEOUT: ErrorTemplate(
-        category=ErrorCategory.DATA_FETCH,
-        user_message="Thanos query execution timed out",
-    ),
-    ErrorCode.THANOS_INVALID_RESPONSE: ErrorTemplate(
-        category=ErrorCategory.DATA_FETCH,
-        user_message="received invalid response from thanos",
-    ),
-    ErrorCode.THANOS_CONNECTION_ERROR: ErrorTemplate(
-        category=ErrorCategory.DATA_FETCH,
-        user_message="failed to connect to thanos endpoint",
-    ),
-    ErrorCode.PROMETHEUS_QUERY_INVALID: ErrorTemplate(
-        category=ErrorCategory.DATA_FETCH,
-        user_message="prometheus query syntax is invalid",
-    ),
-    # Validation errors
-    ErrorCode.VALIDATION_INVALID_PARAMETER: ErrorTemplate(
-        category=ErrorCategory.VALIDATION,
-        user_message="provided parameter value is invalid",
-    ),
-    ErrorCode.VALIDATION_MISSING_PARAMETER: ErrorTemplate(
-        category=ErrorCategory.VALIDATION,
-        user_message="required parameter is missing",
-    ),
-    ErrorCode.VALIDATION_INVALID_DATE_FORMAT: ErrorTemplate(
-        category=ErrorCategory.VALIDATION,
-        user_message="date format is invalid, expected format: yyyy-mm-dd hh:mm:ss",
-    ),
-    ErrorCode.VALIDATION_INVALID_DATE_RANGE: ErrorTemplate(
-        category=ErrorCategory.VALIDATION,
-        user_message="date range is invalid, start date must be before end date",
-    ),
-    ErrorCode.VALIDATION_INVALID_QUERY_PARAMS: ErrorTemplate(
-        category=ErrorCategory.VALIDATION,
-        user_message="invalid query parameters provided",
-    ),
-    ErrorCode.VALIDATION_INVALID_SAMPLING_RATE: ErrorTemplate(
-        category=ErrorCategory.VALIDATION,
-        user_message="sampling rate is invalid",
-    ),
-    # File system errors
-    ErrorCode.FILE_NOT_FOUND: ErrorTemplate(
-        category=ErrorCategory.FILE_SYSTEM,
-        user_message="specified file was not found",
-    ),
-    ErrorCode.FILE_READ_ERROR: ErrorTemplate(
-        category=ErrorCategory.FILE_SYSTEM,
-        user_message="failed to read file",
-    ),
-    ErrorCode.FILE_WRITE_ERROR: ErrorTemplate(
-        category=ErrorCategory.FILE_SYSTEM,
-        user_message="failed to write to file",
-    ),
-    ErrorCode.FILE_PERMISSION_DENIED: ErrorTemplate(
-        category=ErrorCategory.FILE_SYSTEM,
-        user_message="permission denied for file operation",
-    ),
-    ErrorCode.FILE_INVALID_FORMAT: ErrorTemplate(
-        category=ErrorCategory.FILE_SYSTEM,
-        user_message="file format is invalid or not supported",
-    ),
-    ErrorCode.DIRECTORY_NOT_FOUND: ErrorTemplate(
-        category=ErrorCategory.FILE_SYSTEM,
-        user_message="specified directory was not found",
-    ),
-    ErrorCode.DIRECTORY_CREATE_ERROR: ErrorTemplate(
-        category=ErrorCategory.FILE_SYSTEM,
-        user_message="failed to create directory",
-    ),
-    # Azure Storage errors
-    ErrorCode.AZURE_STORAGE_CONNECTION_ERROR: ErrorTemplate(
-        category=ErrorCategory.FILE_SYSTEM,
-        user_message="failed to connect to azure storage",
-    ),
-    ErrorCode.AZURE_STORAGE_BLOB_NOT_FOUND: ErrorTemplate(
-        category=ErrorCategory.FILE_SYSTEM,
-        user_message="specified blob was not found in azure storage",
-    ),
-    ErrorCode.AZURE_STORAGE_UPLOAD_FAILED: ErrorTemplate(
-        category=ErrorCategory.FILE_SYSTEM,
-        user_message="failed to upload file to azure storage",
-    ),
-    ErrorCode.AZURE_STORAGE_DOWNLOAD_FAILED: ErrorTemplate(
-        category=ErrorCategory.FILE_SYSTEM,
-        user_message="failed to download file from azure storage",
-    ),
-    ErrorCode.AZURE_STORAGE_AUTH_FAILED: ErrorTemplate(
-        category=ErrorCategory.FILE_SYSTEM,
-        user_message="azure storage authentication failed",
-    ),
-    ErrorCode.AZURE_STORAGE_CONTAINER_NOT_FOUND: ErrorTemplate(
-        category=ErrorCategory.FILE_SYSTEM,
-        user_message="specified container was not found in azure storage",
-    ),
-    # Computation errors
-    ErrorCode.COMPUTATION_FAILED: ErrorTemplate(
-        category=ErrorCategory.COMPUTATION,
-        user_message="computation failed",
-    ),
-    ErrorCode.COMPUTATION_INVALID_INPUT: ErrorTemplate(
-        category=ErrorCategory.COMPUTATION,
-        user_message="invalid input provided for computation",
-    ),
-    ErrorCode.COMPUTATION_DIVISION_BY_ZERO: ErrorTemplate(
-        category=ErrorCategory.COMPUTATION,
-        user_message="division by zero encountered in computation",
-    ),
-    ErrorCode.COMPUTATION_OVERFLOW: ErrorTemplate(
-        category=ErrorCategory.COMPUTATION,
-        user_message="numeric overflow encountered in computation",
-    ),
-    ErrorCode.COMPUTATION_MISSING_DATA: ErrorTemplate(
-        category=ErrorCategory.COMPUTATION,
-        user_message="required data missing for computation",
-    ),
-    # Impact Framework errors
-    ErrorCode.IF_EXECUTION_FAILED: ErrorTemplate(
-        category=ErrorCategory.IMPACT_FRAMEWORK,
-        user_message="impact framework execution failed",
-    ),
-    ErrorCode.IF_INVALID_MANIFEST: ErrorTemplate(
-        category=ErrorCategory.IMPACT_FRAMEWORK,
-        user_message="impact framework manifest is invalid",
-    ),
-    ErrorCode.IF_PLUGIN_ERROR: ErrorTemplate(
-        category=ErrorCategory.IMPACT_FRAMEWORK,
-        user_message="impact framework plugin encountered an error",
-    ),
-    ErrorCode.IF_OUTPUT_INVALID: ErrorTemplate(
-        category=ErrorCategory.IMPACT_FRAMEWORK,
-        user_message="impact framework output is invalid",
-    ),
-    ErrorCode.IF_METADATA_MISSING: ErrorTemplate(
-        category=ErrorCategory.IMPACT_FRAMEWORK,
-        user_message="impact framework metadata is missing",
-    ),
-    ErrorCode.IF_CLOUD_METADATA_FETCH_FAILED: ErrorTemplate(
-        category=ErrorCategory.IMPACT_FRAMEWORK,
-        user_message="failed to fetch cloud metadata for impact framework",
-    ),
-    # Database errors
-    ErrorCode.DB_CONNECTION_ERROR: ErrorTemplate(
-        category=ErrorCategory.DATABASE,
-        user_message="failed to connect to database",
-    ),
-    ErrorCode.DB_QUERY_FAILED: ErrorTemplate(
-        category=ErrorCategory.DATABASE,
-        user_message="database query failed",
-    ),
-    ErrorCode.DB_INSERT_FAILED: ErrorTemplate(
-        category=ErrorCategory.DATABASE,
-        user_message="failed to insert data into database",
-    ),
-    ErrorCode.DB_UPDATE_FAILED: ErrorTemplate(
-        category=ErrorCategory.DATABASE,
-        user_message="failed to update data in database",
-    ),
-    ErrorCode.DB_DELETE_FAILED: ErrorTemplate(
-        category=ErrorCategory.DATABASE,
-        user_message="failed to delete data from database",
-    ),
-    # External API errors
-    ErrorCode.EXTERNAL_API_ERROR: ErrorTemplate(
-        category=ErrorCategory.EXTERNAL_API,
-        user_message="external API request failed",
-    ),
-    ErrorCode.EXTERNAL_API_TIMEOUT: ErrorTemplate(
-        category=ErrorCategory.EXTERNAL_API,
-        user_message="external API request timed out",
-    ),
-    ErrorCode.EXTERNAL_API_INVALID_RESPONSE: ErrorTemplate(
-        category=ErrorCategory.EXTERNAL_API,
-        user_message="received invalid response from external API",
-    ),
-    ErrorCode.EXTERNAL_API_RATE_LIMIT: ErrorTemplate(
-        category=ErrorCategory.EXTERNAL_API,
-        user_message="external API rate limit exceeded",
-    ),
-    # Report generation errors
-    ErrorCode.REPORT_GENERATION_FAILED: ErrorTemplate(
-        category=ErrorCategory.COMPUTATION,
-        user_message="report generation failed",
-    ),
-    ErrorCode.REPORT_INVALID_DATA: ErrorTemplate(
-        category=ErrorCategory.COMPUTATION,
-        user_message="invalid data provided for report generation",
-    ),
-    ErrorCode.REPORT_WRITE_FAILED: ErrorTemplate(
-        category=ErrorCategory.COMPUTATION,
-        user_message="failed to write report to destination",
-    ),
-    ErrorCode.REPORT_TEMPLATE_ERROR: ErrorTemplate(
-        category=ErrorCategory.COMPUTATION,
-        user_message="report template processing failed",
-    ),
-}
+ERRORS: MappingProxyType[ErrorCode, ErrorTemplate] = MappingProxyType(
+    {
+        # Configuration errors
+        ErrorCode.CONFIG_MISSING_PARAMETERS: ErrorTemplate(
+            category=ErrorCategory.CONFIGURATION,
+            user_message="required parameters are missing: ",
+        ),
+        ErrorCode.CONFIG_FILE_MISSING: ErrorTemplate(
+            category=ErrorCategory.CONFIGURATION,
+            user_message="path provided for configuration was not found",
+        ),
+        ErrorCode.CONFIG_INVALID_FILE: ErrorTemplate(
+            category=ErrorCategory.CONFIGURATION,
+            user_message="configuration file is empty, invalid, or contains only comments",
+        ),
+        ErrorCode.CONFIG_INVALID_YAML: ErrorTemplate(
+            category=ErrorCategory.CONFIGURATION,
+            user_message="configuration file contains invalid YAML syntax",
+        ),
+        ErrorCode.CONFIG_INVALID_JSON: ErrorTemplate(
+            category=ErrorCategory.CONFIGURATION,
+            user_message="configuration file contains invalid JSON syntax",
+        ),
+        ErrorCode.CONFIG_INVALID_VALUE: ErrorTemplate(
+            category=ErrorCategory.CONFIGURATION,
+            user_message="configuration contains an invalid value",
+        ),
+        ErrorCode.CONFIG_VALIDATION_FAILED: ErrorTemplate(
+            category=ErrorCategory.CONFIGURATION,
+            user_message="configuration validation failed",
+        ),
+        # Authentication errors
+        ErrorCode.AUTH_TOKEN_EXPIRED: ErrorTemplate(
+            category=ErrorCategory.AUTHENTICATION,
+            user_message="authentication token has expired",
+        ),
+        ErrorCode.AUTH_TOKEN_INVALID: ErrorTemplate(
+            category=ErrorCategory.AUTHENTICATION,
+            user_message="authentication token is invalid",
+        ),
+        ErrorCode.AUTH_CREDENTIALS_MISSING: ErrorTemplate(
+            category=ErrorCategory.AUTHENTICATION,
+            user_message="authentication credentials are missing",
+        ),
+        ErrorCode.AUTH_CREDENTIALS_INVALID: ErrorTemplate(
+            category=ErrorCategory.AUTHENTICATION,
+            user_message="authentication credentials are invalid",
+        ),
+        ErrorCode.AUTH_TOKEN_REFRESH_FAILED: ErrorTemplate(
+            category=ErrorCategory.AUTHENTICATION,
+            user_message="failed to refresh authentication token after multiple attempts",
+        ),
+        ErrorCode.AUTH_UNAUTHORIZED: ErrorTemplate(
+            category=ErrorCategory.AUTHENTICATION,
+            user_message="unauthorized access - authentication required",
+        ),
+        # Data fetch errors
+        ErrorCode.DATA_FETCH_FAILED: ErrorTemplate(
+            category=ErrorCategory.DATA_FETCH,
+            user_message="failed to fetch data from the remote source",
+        ),
+        ErrorCode.DATA_FETCH_TIMEOUT: ErrorTemplate(
+            category=ErrorCategory.DATA_FETCH,
+            user_message="data fetch operation timed out",
+        ),
+        ErrorCode.DATA_FETCH_NO_RESULTS: ErrorTemplate(
+            category=ErrorCategory.DATA_FETCH,
+            user_message="no results returned from data source",
+        ),
+        ErrorCode.DATA_FETCH_INVALID_RESPONSE: ErrorTemplate(
+            category=ErrorCategory.DATA_FETCH,
+            user_message="received invalid response from data source",
+        ),
+        ErrorCode.DATA_FETCH_CONNECTION_ERROR: ErrorTemplate(
+            category=ErrorCategory.DATA_FETCH,
+            user_message="failed to establish connection to data source",
+        ),
+        ErrorCode.DATA_FETCH_QUERY_INVALID: ErrorTemplate(
+            category=ErrorCategory.DATA_FETCH,
+            user_message="query syntax is invalid",
+        ),
+        # Thanos/Prometheus errors
+        ErrorCode.THANOS_QUERY_FAILED: ErrorTemplate(
+            category=ErrorCategory.DATA_FETCH,
+            user_message="failed to execute thanos query",
+        ),
+        ErrorCode.THANOS_TIMEOUT: ErrorTemplate(
+            category=ErrorCategory.DATA_FETCH,
+            user_message="Thanos query execution timed out",
+        ),
+        ErrorCode.THANOS_INVALID_RESPONSE: ErrorTemplate(
+            category=ErrorCategory.DATA_FETCH,
+            user_message="received invalid response from thanos",
+        ),
+        ErrorCode.THANOS_CONNECTION_ERROR: ErrorTemplate(
+            category=ErrorCategory.DATA_FETCH,
+            user_message="failed to connect to thanos endpoint",
+        ),
+        ErrorCode.PROMETHEUS_QUERY_INVALID: ErrorTemplate(
+            category=ErrorCategory.DATA_FETCH,
+            user_message="prometheus query syntax is invalid",
+        ),
+        # Validation errors
+        ErrorCode.VALIDATION_INVALID_PARAMETER: ErrorTemplate(
+            category=ErrorCategory.VALIDATION,
+            user_message="provided parameter value is invalid",
+        ),
+        ErrorCode.VALIDATION_MISSING_PARAMETER: ErrorTemplate(
+            category=ErrorCategory.VALIDATION,
+            user_message="required parameter is missing",
+        ),
+        ErrorCode.VALIDATION_INVALID_DATE_FORMAT: ErrorTemplate(
+            category=ErrorCategory.VALIDATION,
+            user_message="date format is invalid, expected format: yyyy-mm-dd hh:mm:ss",
+        ),
+        ErrorCode.VALIDATION_INVALID_DATE_RANGE: ErrorTemplate(
+            category=ErrorCategory.VALIDATION,
+            user_message="date range is invalid, start date must be before end date",
+        ),
+        ErrorCode.VALIDATION_INVALID_QUERY_PARAMS: ErrorTemplate(
+            category=ErrorCategory.VALIDATION,
+            user_message="invalid query parameters provided",
+        ),
+        ErrorCode.VALIDATION_INVALID_SAMPLING_RATE: ErrorTemplate(
+            category=ErrorCategory.VALIDATION,
+            user_message="sampling rate is invalid",
+        ),
+        # File system errors
+        ErrorCode.FILE_NOT_FOUND: ErrorTemplate(
+            category=ErrorCategory.FILE_SYSTEM,
+            user_message="specified file was not found",
+        ),
+        ErrorCode.FILE_READ_ERROR: ErrorTemplate(
+            category=ErrorCategory.FILE_SYSTEM,
+            user_message="failed to read file",
+        ),
+        ErrorCode.FILE_WRITE_ERROR: ErrorTemplate(
+            category=ErrorCategory.FILE_SYSTEM,
+            user_message="failed to write to file",
+        ),
+        ErrorCode.FILE_PERMISSION_DENIED: ErrorTemplate(
+            category=ErrorCategory.FILE_SYSTEM,
+            user_message="permission denied for file operation",
+        ),
+        ErrorCode.FILE_INVALID_FORMAT: ErrorTemplate(
+            category=ErrorCategory.FILE_SYSTEM,
+            user_message="file format is invalid or not supported",
+        ),
+        ErrorCode.DIRECTORY_NOT_FOUND: ErrorTemplate(
+            category=ErrorCategory.FILE_SYSTEM,
+            user_message="specified directory was not found",
+        ),
+        ErrorCode.DIRECTORY_CREATE_ERROR: ErrorTemplate(
+            category=ErrorCategory.FILE_SYSTEM,
+            user_message="failed to create directory",
+        ),
+        # Azure Storage errors
+        ErrorCode.AZURE_STORAGE_CONNECTION_ERROR: ErrorTemplate(
+            category=ErrorCategory.FILE_SYSTEM,
+            user_message="failed to connect to azure storage",
+        ),
+        ErrorCode.AZURE_STORAGE_BLOB_NOT_FOUND: ErrorTemplate(
+            category=ErrorCategory.FILE_SYSTEM,
+            user_message="specified blob was not found in azure storage",
+        ),
+        ErrorCode.AZURE_STORAGE_UPLOAD_FAILED: ErrorTemplate(
+            category=ErrorCategory.FILE_SYSTEM,
+            user_message="failed to upload file to azure storage",
+        ),
+        ErrorCode.AZURE_STORAGE_DOWNLOAD_FAILED: ErrorTemplate(
+            category=ErrorCategory.FILE_SYSTEM,
+            user_message="failed to download file from azure storage",
+        ),
+        ErrorCode.AZURE_STORAGE_AUTH_FAILED: ErrorTemplate(
+            category=ErrorCategory.FILE_SYSTEM,
+            user_message="azure storage authentication failed",
+        ),
+        ErrorCode.AZURE_STORAGE_CONTAINER_NOT_FOUND: ErrorTemplate(
+            category=ErrorCategory.FILE_SYSTEM,
+            user_message="specified container was not found in azure storage",
+        ),
+        # Computation errors
+        ErrorCode.COMPUTATION_FAILED: ErrorTemplate(
+            category=ErrorCategory.COMPUTATION,
+            user_message="computation failed",
+        ),
+        ErrorCode.COMPUTATION_INVALID_INPUT: ErrorTemplate(
+            category=ErrorCategory.COMPUTATION,
+            user_message="invalid input provided for computation",
+        ),
+        ErrorCode.COMPUTATION_DIVISION_BY_ZERO: ErrorTemplate(
+            category=ErrorCategory.COMPUTATION,
+            user_message="division by zero encountered in computation",
+        ),
+        ErrorCode.COMPUTATION_OVERFLOW: ErrorTemplate(
+            category=ErrorCategory.COMPUTATION,
+            user_message="numeric overflow encountered in computation",
+        ),
+        ErrorCode.COMPUTATION_MISSING_DATA: ErrorTemplate(
+            category=ErrorCategory.COMPUTATION,
+            user_message="required data missing for computation",
+        ),
+        # Impact Framework errors
+        ErrorCode.IF_EXECUTION_FAILED: ErrorTemplate(
+            category=ErrorCategory.IMPACT_FRAMEWORK,
+            user_message="impact framework execution failed",
+        ),
+        ErrorCode.IF_INVALID_MANIFEST: ErrorTemplate(
+            category=ErrorCategory.IMPACT_FRAMEWORK,
+            user_message="impact framework manifest is invalid",
+        ),
+        ErrorCode.IF_PLUGIN_ERROR: ErrorTemplate(
+            category=ErrorCategory.IMPACT_FRAMEWORK,
+            user_message="impact framework plugin encountered an error",
+        ),
+        ErrorCode.IF_OUTPUT_INVALID: ErrorTemplate(
+            category=ErrorCategory.IMPACT_FRAMEWORK,
+            user_message="impact framework output is invalid",
+        ),
+        ErrorCode.IF_METADATA_MISSING: ErrorTemplate(
+            category=ErrorCategory.IMPACT_FRAMEWORK,
+            user_message="impact framework metadata is missing",
+        ),
+        ErrorCode.IF_CLOUD_METADATA_FETCH_FAILED: ErrorTemplate(
+            category=ErrorCategory.IMPACT_FRAMEWORK,
+            user_message="failed to fetch cloud metadata for impact framework",
+        ),
+        # Database errors
+        ErrorCode.DB_CONNECTION_ERROR: ErrorTemplate(
+            category=ErrorCategory.DATABASE,
+            user_message="failed to connect to database",
+        ),
+        ErrorCode.DB_QUERY_FAILED: ErrorTemplate(
+            category=ErrorCategory.DATABASE,
+            user_message="database query failed",
+        ),
+        ErrorCode.DB_INSERT_FAILED: ErrorTemplate(
+            category=ErrorCategory.DATABASE,
+            user_message="failed to insert data into database",
+        ),
+        ErrorCode.DB_UPDATE_FAILED: ErrorTemplate(
+            category=ErrorCategory.DATABASE,
+            user_message="failed to update data in database",
+        ),
+        ErrorCode.DB_DELETE_FAILED: ErrorTemplate(
+            category=ErrorCategory.DATABASE,
+            user_message="failed to delete data from database",
+        ),
+        # External API errors
+        ErrorCode.EXTERNAL_API_ERROR: ErrorTemplate(
+            category=ErrorCategory.EXTERNAL_API,
+            user_message="external API request failed",
+        ),
+        ErrorCode.EXTERNAL_API_TIMEOUT: ErrorTemplate(
+            category=ErrorCategory.EXTERNAL_API,
+            user_message="external API request timed out",
+        ),
+        ErrorCode.EXTERNAL_API_INVALID_RESPONSE: ErrorTemplate(
+            category=ErrorCategory.EXTERNAL_API,
+            user_message="received invalid response from external API",
+        ),
+        ErrorCode.EXTERNAL_API_RATE_LIMIT: ErrorTemplate(
+            category=ErrorCategory.EXTERNAL_API,
+            user_message="external API rate limit exceeded",
+        ),
+        # Report generation errors
+        ErrorCode.REPORT_GENERATION_FAILED: ErrorTemplate(
+            category=ErrorCategory.COMPUTATION,
+            user_message="report generation failed",
+        ),
+        ErrorCode.REPORT_INVALID_DATA: ErrorTemplate(
+            category=ErrorCategory.COMPUTATION,
+            user_message="invalid data provided for report generation",
+        ),
+        ErrorCode.REPORT_WRITE_FAILED: ErrorTemplate(
+            category=ErrorCategory.COMPUTATION,
+            user_message="failed to write report to destination",
+        ),
+        ErrorCode.REPORT_TEMPLATE_ERROR: ErrorTemplate(
+            category=ErrorCategory.COMPUTATION,
+            user_message="report template processing failed",
+        ),
+    }
+)
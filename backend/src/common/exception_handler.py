@@ -8,10 +8,12 @@ mapping custom exceptions to appropriate HTTP responses with consistent error fo
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any
-from fastapi import FastAPI, HTTPException, Request, status
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from backend.src.common.known_exception import (
     KnownException,
 )
@@ -20,9 +22,42 @@ from backend.src.common.errors import ErrorCode, ErrorCategory
 logger = logging.getLogger(__name__)
 
 
-def get_status_code_for_error(error_code: ErrorCode) -> int:
+class EncodedHTTPException(HTTPException):
     """
-    Map error codes to appropriate HTTP status codes.
+    HTTPException carrying an already encoded standardized error response.
+
+    The detail stays the standardized error dict, the encoded_body is only a
+    shortcut for http_exception_handler.
+    """
+
+    def __init__(
+        self, status_code: int, detail: dict[str, Any], encoded_body: bytes
+    ) -> None:
+        super().__init__(status_code=status_code, detail=detail)
+        self.encoded_body = encoded_body
+
+
+_AUTH_FORBIDDEN_CODES = frozenset({ErrorCode.AUTH_UNAUTHORIZED})
+_DATA_FETCH_TIMEOUT_CODES = frozenset(
+    {ErrorCode.DATA_FETCH_TIMEOUT, ErrorCode.THANOS_TIMEOUT}
+)
+_DATA_FETCH_NOT_FOUND_CODES = frozenset({ErrorCode.DATA_FETCH_NO_RESULTS})
+_FILE_NOT_FOUND_CODES = frozenset(
+    {
+        ErrorCode.FILE_NOT_FOUND,
+        ErrorCode.DIRECTORY_NOT_FOUND,
+        ErrorCode.AZURE_STORAGE_BLOB_NOT_FOUND,
+        ErrorCode.AZURE_STORAGE_CONTAINER_NOT_FOUND,
+    }
+)
+_FILE_FORBIDDEN_CODES = frozenset({ErrorCode.FILE_PERMISSION_DENIED})
+
+
+def _compute_status_code(error_code: ErrorCode) -> int:
+    """
+    Compute the HTTP status code for an error code from its numeric range.
+
+    Only used at import time to build the status lookup table.
 
     Args:
         error_code: The error code to map.
@@ -30,62 +65,52 @@ def get_status_code_for_error(error_code: ErrorCode) -> int:
     Returns:
         The appropriate HTTP status code.
     """
+    code_range = int(error_code.value) // 1000
+
     # Configuration errors (usually 500 or 503)
-    if error_code.value.startswith("1"):
+    if code_range == 1:
         return status.HTTP_503_SERVICE_UNAVAILABLE
 
     # Authentication errors (401 or 403)
-    if error_code.value.startswith("2"):
-        if error_code in [ErrorCode.AUTH_UNAUTHORIZED]:
+    if code_range == 2:
+        if error_code in _AUTH_FORBIDDEN_CODES:
             return status.HTTP_403_FORBIDDEN
         return status.HTTP_401_UNAUTHORIZED
 
     # Data fetch errors (usually 502 or 503)
-    if error_code.value.startswith("3"):
-        if error_code in [
-            ErrorCode.DATA_FETCH_TIMEOUT,
-            ErrorCode.THANOS_TIMEOUT,
-        ]:
+    if code_range == 3:
+        if error_code in _DATA_FETCH_TIMEOUT_CODES:
             return status.HTTP_504_GATEWAY_TIMEOUT
-        if error_code in [
-            ErrorCode.DATA_FETCH_NO_RESULTS,
-        ]:
+        if error_code in _DATA_FETCH_NOT_FOUND_CODES:
             return status.HTTP_404_NOT_FOUND
         return status.HTTP_502_BAD_GATEWAY
 
     # Validation errors (400 or 422)
-    if error_code.value.startswith("4"):
+    if code_range == 4:
         return status.HTTP_422_UNPROCESSABLE_ENTITY
 
     # File system errors (usually 404 or 500)
-    if error_code.value.startswith("5"):
-        if error_code in [
-            ErrorCode.FILE_NOT_FOUND,
-            ErrorCode.DIRECTORY_NOT_FOUND,
-            ErrorCode.AZURE_STORAGE_BLOB_NOT_FOUND,
-            ErrorCode.AZURE_STORAGE_CONTAINER_NOT_FOUND,
-        ]:
+    if code_range == 5:
+        if error_code in _FILE_NOT_FOUND_CODES:
             return status.HTTP_404_NOT_FOUND
-        if error_code in [
-            ErrorCode.FILE_PERMISSION_DENIED,
-        ]:
+        if error_code in _FILE_FORBIDDEN_CODES:
             return status.HTTP_403_FORBIDDEN
         return status.HTTP_500_INTERNAL_SERVER_ERROR
 
     # Computation errors (usually 500)
-    if error_code.value.startswith("6"):
+    if code_range == 6:
         return status.HTTP_500_INTERNAL_SERVER_ERROR
 
     # Impact Framework errors (usually 500 or 502)
-    if error_code.value.startswith("7"):
+    if code_range == 7:
         return status.HTTP_502_BAD_GATEWAY
 
     # Database errors (usually 500 or 503)
-    if error_code.value.startswith("8"):
+    if code_range == 8:
         return status.HTTP_503_SERVICE_UNAVAILABLE
 
     # External API errors (usually 502 or 503)
-    if error_code.value.startswith("9"):
+    if code_range == 9:
         if error_code == ErrorCode.EXTERNAL_API_RATE_LIMIT:
             return status.HTTP_429_TOO_MANY_REQUESTS
         if error_code == ErrorCode.EXTERNAL_API_TIMEOUT:
@@ -93,19 +118,37 @@ def get_status_code_for_error(error_code: ErrorCode) -> int:
         return status.HTTP_502_BAD_GATEWAY
 
     # Report generation errors (usually 500)
-    if error_code.value.startswith("10"):
+    if code_range == 10:
         return status.HTTP_500_INTERNAL_SERVER_ERROR
 
     # Default to internal server error
     return status.HTTP_500_INTERNAL_SERVER_ERROR
 
 
+_STATUS_BY_CODE: dict[ErrorCode, int] = {
+    error_code: _compute_status_code(error_code) for error_code in ErrorCode
+}
+
+
+def get_status_code_for_error(error_code: ErrorCode) -> int:
+    """
+    Map error codes to appropriate HTTP status codes.
+
+    Args:
+        error_code: The error code to map.
+
+    Returns:
+        The appropriate HTTP status code.
+    """
+    return _STATUS_BY_CODE.get(error_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 def create_error_response(
     error_code: str,
     category: str,
     message: str,
-    details: Dict[str, Any] = None,
-) -> Dict[str, Any]:
+    details: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     """
     Create a standardized error response structure.
 
@@ -118,7 +161,17 @@ def create_error_response(
     Returns:
         A dictionary containing the error response.
     """
-    response = {
+    if details:
+        return {
+            "error": {
+                "code": error_code,
+                "category": category,
+                "message": message,
+                "details": details,
+            }
+        }
+
+    return {
         "error": {
             "code": error_code,
             "category": category,
@@ -126,15 +179,24 @@ def create_error_response(
         }
     }
 
-    if details:
-        response["error"]["details"] = details
 
-    return response
+@lru_cache(maxsize=256)
+def _encoded_error(error_code: str, category: str, message: str) -> bytes:
+    """
+    Encode an error response without details, reusing the bytes of repeated errors.
 
+    Args:
+        error_code: The error code.
+        category: The error category.
+        message: The error message.
 
-async def known_exception_handler(
-    request: Request, exc: KnownException
-) -> JSONResponse:
+    Returns:
+        The JSON encoded error response.
+    """
+    return orjson.dumps(create_error_response(error_code, category, message))
+
+
+async def known_exception_handler(request: Request, exc: KnownException) -> Response:
     """
     Handle KnownException and its subclasses.
 
@@ -146,64 +208,50 @@ async def known_exception_handler(
         A JSON response with appropriate status code and error details.
     """
     status_code = get_status_code_for_error(exc.error_code)
+    error_code = exc.error_code.value
+    message = exc.formatted_string
+    is_server_error = status_code >= 500
 
     # Log the error with appropriate level based on status code
-    if status_code >= 500:
-        logger.error(
-            "Known exception occurred: [%s] %s",
-            exc.error_code.value,
-            exc.formatted_string,
-            exc_info=True,
-        )
-    else:
-        logger.warning(
-            "Known exception occurred: [%s] %s",
-            exc.error_code.value,
-            exc.formatted_string,
-        )
+    logger.log(
+        logging.ERROR if is_server_error else logging.WARNING,
+        "Known exception occurred: [%s] %s",
+        error_code,
+        message,
+        exc_info=is_server_error,
+    )
 
-    # Build details dictionary
-    details: Dict[str, Any] = {}
-
-    # Add exception-specific details
-    if hasattr(exc, "missing") and exc.missing:
-        details["missing_parameters"] = exc.missing
-    if hasattr(exc, "file_path") and exc.file_path:
-        details["file_path"] = exc.file_path
-    if hasattr(exc, "path") and exc.path:
-        details["path"] = exc.path
-    if hasattr(exc, "query") and exc.query:
-        details["query"] = exc.query[:200]  # Truncate long queries
-    if hasattr(exc, "field_name") and exc.field_name:
-        details["field"] = exc.field_name
-    if hasattr(exc, "invalid_value") and exc.invalid_value:
-        details["invalid_value"] = str(exc.invalid_value)
-    if hasattr(exc, "source") and exc.source:
-        details["source"] = exc.source
-    if hasattr(exc, "operation") and exc.operation:
-        details["operation"] = exc.operation
-    if hasattr(exc, "api_name") and exc.api_name:
-        details["api"] = exc.api_name
-    if hasattr(exc, "endpoint") and exc.endpoint:
-        details["endpoint"] = exc.endpoint
-    if hasattr(exc, "container") and exc.container:
-        details["container"] = exc.container
-    if hasattr(exc, "blob_name") and exc.blob_name:
-        details["blob"] = exc.blob_name
+    # Add exception-specific details declared by the exception class
+    details: dict[str, Any] = {
+        key: value
+        for attribute, key in exc.DETAIL_FIELDS
+        if (value := getattr(exc, attribute, None))
+    }
+    if "query" in details:
+        details["query"] = details["query"][:200]  # Truncate long queries
+    if "invalid_value" in details:
+        details["invalid_value"] = str(details["invalid_value"])
+
+    if not details:
+        return Response(
+            content=_encoded_error(error_code, exc.category, message),
+            status_code=status_code,
+            media_type="application/json",
+        )
 
     response = create_error_response(
-        error_code=exc.error_code.value,
+        error_code=error_code,
         category=exc.category,
-        message=exc.formatted_string,
-        details=details if details else None,
+        message=message,
+        details=details,
     )
 
-    return JSONResponse(status_code=status_code, content=response)
+    return ORJSONResponse(status_code=status_code, content=response)
 
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> Response:
     """
     Handle FastAPI/Pydantic validation errors.
 
@@ -214,19 +262,18 @@ async def validation_exception_handler(
     Returns:
         A JSON response with validation error details.
     """
-    logger.warning("Validation error occurred: %s", exc.errors())
+    errors = exc.errors()
+    logger.warning("Validation error occurred: %s", errors)
 
     # Extract field names and error messages
-    validation_errors = []
-    for error in exc.errors():
-        field = ".".join(str(loc) for loc in error["loc"])
-        validation_errors.append(
-            {
-                "field": field,
-                "message": error["msg"],
-                "type": error["type"],
-            }
-        )
+    validation_errors = [
+        {
+            "field": ".".join(map(str, error["loc"])),
+            "message": error["msg"],
+            "type": error["type"],
+        }
+        for error in errors
+    ]
 
     response = create_error_response(
         error_code=ErrorCode.VALIDATION_INVALID_PARAMETER.value,
@@ -235,13 +282,13 @@ async def validation_exception_handler(
         details={"validation_errors": validation_errors},
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=response,
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
     """
     Handle HTTPException from FastAPI.
 
@@ -254,6 +301,13 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     """
     logger.warning("HTTP exception occurred: %s - %s", exc.status_code, exc.detail)
 
+    if isinstance(exc, EncodedHTTPException):
+        return Response(
+            content=exc.encoded_body,
+            status_code=exc.status_code,
+            media_type="application/json",
+        )
+
     # Map status codes to categories
     if exc.status_code >= 500:
         category = "server error"
@@ -268,10 +322,10 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         message=exc.detail if isinstance(exc.detail, str) else str(exc.detail),
     )
 
-    return JSONResponse(status_code=exc.status_code, content=response)
+    return ORJSONResponse(status_code=exc.status_code, content=response)
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Handle unexpected exceptions.
 
@@ -291,7 +345,7 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
         message="An unexpected error occurred. Please contact support if the issue persists.",
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=response,
     )
@@ -318,7 +372,7 @@ def raise_http_error(
     error_code: str,
     category: str,
     message: str,
-    details: Dict[str, Any] = None,
+    details: dict[str, Any] | None = None,
 ) -> None:
     """
     Raise an HTTPException with standardized error format.
@@ -331,4 +385,6 @@ def raise_http_error(
         details: Optional additional details.
     """
     error_response = create_error_response(error_code, category, message, details)
-    raise HTTPException(status_code=status_code, detail=error_response)
+    raise EncodedHTTPException(
+        status_code, error_response, orjson.dumps(error_response)
+    )
@@ -11,6 +11,11 @@ from __future__ import annotations
 from backend.src.common.errors import ERRORS, ErrorCode
 
 
+def _join_details(*parts: str | None) -> str | None:
+    """Join the non-empty detail fragments, or return None when there are none."""
+    return ", ".join(part for part in parts if part) or None
+
+
 class KnownException(Exception):
     """
     Base custom exception class for handling known exceptions.
@@ -18,6 +23,11 @@ class KnownException(Exception):
     All custom exceptions in the application should inherit from this class.
     """
 
+    __slots__ = ("error_code", "template", "details", "_formatted_string")
+
+    # (attribute, response key) pairs exposed in the API error details
+    DETAIL_FIELDS: tuple[tuple[str, str], ...] = ()
+
     def __init__(self, error_code: ErrorCode, details: str | None = None):
         """
         Initialize a KnownException.
@@ -29,19 +39,21 @@ class KnownException(Exception):
         self.error_code = error_code
         self.template = ERRORS[error_code]
         self.details = details
-        self._formatted_string = self._build_message()
+        self._formatted_string: str | None = None
         super().__init__(self.template.message)
 
     def _build_message(self) -> str:
         """Build the formatted error message."""
-        base_message = self.template.to_string()
+        base_message = self.template.message
         if self.details:
             return f"{base_message}: {self.details}"
         return base_message
 
     @property
     def formatted_string(self) -> str:
-        """Get the formatted error string."""
+        """Get the formatted error string, building it on first access."""
+        if self._formatted_string is None:
+            self._formatted_string = self._build_message()
         return self._formatted_string
 
     @property
@@ -56,10 +68,16 @@ class KnownException(Exception):
 class ConfigurationError(KnownException):
     """Base class for configuration-related errors."""
 
+    __slots__ = ()
+
 
 class MissingParametersError(ConfigurationError):
     """Exception raised when required parameters are missing."""
 
+    __slots__ = ("missing",)
+
+    DETAIL_FIELDS = (("missing", "missing_parameters"),)
+
     def __init__(self, error_code: ErrorCode, missing: list[str]):
         """
         Initialize a MissingParametersError.
@@ -73,13 +91,17 @@ class MissingParametersError(ConfigurationError):
 
     def _build_message(self) -> str:
         """Build the formatted error message with missing parameters."""
-        base_message = self.template.to_string()
+        base_message = self.template.message
         return f"{base_message}{', '.join(self.missing)}"
 
 
 class ConfigFileError(ConfigurationError):
     """Exception raised for configuration file errors."""
 
+    __slots__ = ("file_path",)
+
+    DETAIL_FIELDS = (("file_path", "file_path"),)
+
     def __init__(self, error_code: ErrorCode, file_path: Optional[str] = None):
         """
         Initialize a ConfigFileError.
@@ -96,6 +118,8 @@ class ConfigFileError(ConfigurationError):
 class ConfigValidationError(ConfigurationError):
     """Exception raised when configuration validation fails."""
 
+    __slots__ = ("validation_errors",)
+
     def __init__(
         self, error_code: ErrorCode, validation_errors: Optional[list[str]] = None
     ):
@@ -117,10 +141,14 @@ class ConfigValidationError(ConfigurationError):
 class AuthenticationError(KnownException):
     """Base class for authentication-related errors."""
 
+    __slots__ = ()
+
 
 class TokenError(AuthenticationError):
     """Exception raised for token-related errors."""
 
+    __slots__ = ()
+
     def __init__(self, error_code: ErrorCode, token_info: Optional[str] = None):
         """
         Initialize a TokenError.
@@ -135,6 +163,8 @@ class TokenError(AuthenticationError):
 class CredentialsError(AuthenticationError):
     """Exception raised for credential-related errors."""
 
+    __slots__ = ()
+
     def __init__(self, error_code: ErrorCode, credential_type: Optional[str] = None):
         """
         Initialize a CredentialsError.
@@ -152,6 +182,10 @@ class CredentialsError(AuthenticationError):
 class DataFetchError(KnownException):
     """Base class for data fetching errors."""
 
+    __slots__ = ("source",)
+
+    DETAIL_FIELDS = (("source", "source"),)
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -167,17 +201,19 @@ class DataFetchError(KnownException):
             details: Optional additional details.
         """
         self.source = source
-        message_details = f"source: {source}" if source else None
-        if message_details and details:
-            message_details = f"{message_details}, {details}"
-        elif details:
-            message_details = details
+        message_details = _join_details(
+            f"source: {source}" if source else None, details
+        )
         super().__init__(error_code, message_details)
 
 
 class ThanosError(DataFetchError):
     """Exception raised for Thanos-specific errors."""
 
+    __slots__ = ("query",)
+
+    DETAIL_FIELDS = (("query", "query"), *DataFetchError.DETAIL_FIELDS)
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -204,6 +240,10 @@ class ThanosError(DataFetchError):
 class PrometheusQueryError(DataFetchError):
     """Exception raised for Prometheus query errors."""
 
+    __slots__ = ("query",)
+
+    DETAIL_FIELDS = (("query", "query"), *DataFetchError.DETAIL_FIELDS)
+
     def __init__(
         self, error_code: ErrorCode, query: str, details: Optional[str] = None
     ):
@@ -225,6 +265,10 @@ class PrometheusQueryError(DataFetchError):
 class ValidationError(KnownException):
     """Base class for validation errors."""
 
+    __slots__ = ("field_name", "invalid_value")
+
+    DETAIL_FIELDS = (("field_name", "field"), ("invalid_value", "invalid_value"))
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -252,6 +296,8 @@ class ValidationError(KnownException):
 class DateValidationError(ValidationError):
     """Exception raised for date-related validation errors."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -272,6 +318,8 @@ class DateValidationError(ValidationError):
 class QueryParameterError(ValidationError):
     """Exception raised for query parameter validation errors."""
 
+    __slots__ = ("invalid_params",)
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -297,6 +345,10 @@ class QueryParameterError(ValidationError):
 class FileSystemError(KnownException):
     """Base class for file system errors."""
 
+    __slots__ = ("path",)
+
+    DETAIL_FIELDS = (("path", "path"),)
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -312,17 +364,15 @@ class FileSystemError(KnownException):
             details: Optional additional details.
         """
         self.path = path
-        message_details = f"path: {path}" if path else None
-        if message_details and details:
-            message_details = f"{message_details}, {details}"
-        elif details:
-            message_details = details
+        message_details = _join_details(f"path: {path}" if path else None, details)
         super().__init__(error_code, message_details)
 
 
 class FileNotFoundError(FileSystemError):  # pylint: disable=redefined-builtin
     """Exception raised when a file is not found."""
 
+    __slots__ = ()
+
     def __init__(self, path: str):
         """
         Initialize a FileNotFoundError.
@@ -336,6 +386,8 @@ class FileNotFoundError(FileSystemError):  # pylint: disable=redefined-builtin
 class FileReadError(FileSystemError):
     """Exception raised when a file cannot be read."""
 
+    __slots__ = ()
+
     def __init__(self, path: str, details: Optional[str] = None):
         """
         Initialize a FileReadError.
@@ -350,6 +402,8 @@ class FileReadError(FileSystemError):
 class FileWriteError(FileSystemError):
     """Exception raised when a file cannot be written."""
 
+    __slots__ = ()
+
     def __init__(self, path: str, details: Optional[str] = None):
         """
         Initialize a FileWriteError.
@@ -364,6 +418,8 @@ class FileWriteError(FileSystemError):
 class DirectoryError(FileSystemError):
     """Exception raised for directory-related errors."""
 
+    __slots__ = ()
+
 
 # Azure Storage Exceptions
 
@@ -371,6 +427,14 @@ class DirectoryError(FileSystemError):
 class AzureStorageError(FileSystemError):
     """Base class for Azure Storage errors."""
 
+    __slots__ = ("container", "blob_name")
+
+    DETAIL_FIELDS = (
+        *FileSystemError.DETAIL_FIELDS,
+        ("container", "container"),
+        ("blob_name", "blob"),
+    )
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -389,12 +453,10 @@ class AzureStorageError(FileSystemError):
         """
         self.container = container
         self.blob_name = blob_name
-        path_parts = []
-        if container:
-            path_parts.append(f"container: {container}")
-        if blob_name:
-            path_parts.append(f"blob: {blob_name}")
-        path_str = ", ".join(path_parts) if path_parts else None
+        path_str = _join_details(
+            f"container: {container}" if container else None,
+            f"blob: {blob_name}" if blob_name else None,
+        )
         super().__init__(error_code, path_str, details)
 
 
@@ -404,6 +466,10 @@ class AzureStorageError(FileSystemError):
 class ComputationError(KnownException):
     """Base class for computation errors."""
 
+    __slots__ = ("operation",)
+
+    DETAIL_FIELDS = (("operation", "operation"),)
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -419,17 +485,17 @@ class ComputationError(KnownException):
             details: Optional additional details.
         """
         self.operation = operation
-        message_details = f"operation: {operation}" if operation else None
-        if message_details and details:
-            message_details = f"{message_details}, {details}"
-        elif details:
-            message_details = details
+        message_details = _join_details(
+            f"operation: {operation}" if operation else None, details
+        )
         super().__init__(error_code, message_details)
 
 
 class DivisionByZeroError(ComputationError):
     """Exception raised when division by zero is encountered."""
 
+    __slots__ = ()
+
     def __init__(self, operation: Optional[str] = None):
         """
         Initialize a DivisionByZeroError.
@@ -443,6 +509,8 @@ class DivisionByZeroError(ComputationError):
 class MissingDataError(ComputationError):
     """Exception raised when required data is missing for computation."""
 
+    __slots__ = ()
+
     def __init__(self, missing_data: str, operation: Optional[str] = None):
         """
         Initialize a MissingDataError.
@@ -462,6 +530,8 @@ class MissingDataError(ComputationError):
 class ImpactFrameworkError(KnownException):
     """Base class for Impact Framework errors."""
 
+    __slots__ = ("manifest_path",)
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -477,17 +547,17 @@ class ImpactFrameworkError(KnownException):
             details: Optional additional details.
         """
         self.manifest_path = manifest_path
-        message_details = f"manifest: {manifest_path}" if manifest_path else None
-        if message_details and details:
-            message_details = f"{message_details}, {details}"
-        elif details:
-            message_details = details
+        message_details = _join_details(
+            f"manifest: {manifest_path}" if manifest_path else None, details
+        )
         super().__init__(error_code, message_details)
 
 
 class ImpactFrameworkPluginError(ImpactFrameworkError):
     """Exception raised for Impact Framework plugin errors."""
 
+    __slots__ = ("plugin_name", "error_message")
+
     def __init__(
         self, plugin_name: str, error_message: str, manifest_path: Optional[str] = None
     ):
@@ -511,6 +581,10 @@ class ImpactFrameworkPluginError(ImpactFrameworkError):
 class DatabaseError(KnownException):
     """Base class for database errors."""
 
+    __slots__ = ("query",)
+
+    DETAIL_FIELDS = (("query", "query"),)
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -526,13 +600,10 @@ class DatabaseError(KnownException):
             details: Optional additional details.
         """
         self.query = query
-        message_details = (
-            f"query: {query[:100]}..." if query else None
-        )  # Truncate long queries
-        if message_details and details:
-            message_details = f"{message_details}, {details}"
-        elif details:
-            message_details = details
+        message_details = _join_details(
+            f"query: {query[:100]}..." if query else None,  # Truncate long queries
+            details,
+        )
         super().__init__(error_code, message_details)
 
 
@@ -542,6 +613,10 @@ class DatabaseError(KnownException):
 class ExternalAPIError(KnownException):
     """Base class for external API errors."""
 
+    __slots__ = ("api_name", "endpoint")
+
+    DETAIL_FIELDS = (("api_name", "api"), ("endpoint", "endpoint"))
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -560,14 +635,11 @@ class ExternalAPIError(KnownException):
         """
         self.api_name = api_name
         self.endpoint = endpoint
-        message_parts = []
-        if api_name:
-            message_parts.append(f"API: {api_name}")
-        if endpoint:
-            message_parts.append(f"endpoint: {endpoint}")
-        if details:
-            message_parts.append(details)
-        message_details = ", ".join(message_parts) if message_parts else None
+        message_details = _join_details(
+            f"API: {api_name}" if api_name else None,
+            f"endpoint: {endpoint}" if endpoint else None,
+            details,
+        )
         super().__init__(error_code, message_details)
 
 
@@ -577,6 +649,8 @@ class ExternalAPIError(KnownException):
 class ReportGenerationError(KnownException):
     """Base class for report generation errors."""
 
+    __slots__ = ("report_type",)
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -592,9 +666,7 @@ class ReportGenerationError(KnownException):
             details: Optional additional details.
         """
         self.report_type = report_type
-        message_details = f"report type: {report_type}" if report_type else None
-        if message_details and details:
-            message_details = f"{message_details}, {details}"
-        elif details:
-            message_details = details
+        message_details = _join_details(
+            f"report type: {report_type}" if report_type else None, details
+        )
         super().__init__(error_code, message_details)
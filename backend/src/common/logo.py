@@ -0,0 +1,59 @@
+"""
+This file contains the Carmen ASCII logo printed when the API or the daemon starts.
+"""
+
+CARMEN_LOGO = """
+                                                        ##
+                                     ###                ###
+                                    ####                ####
+                                   #####                #####
+                                  #####                 ######
+                                 #####                 ########
+                                 ####                  ########
+                                #####                 ##########
+                               #####                  ##########
+                              #####                  ###########    #
+                             #####                   ############   ##
+                             ####                   #############    ##
+                            #####                  ##############    ##
+                           #####                  ################   ###
+                          #####                  #################   ####
+                         #####                  ############ #####   #####
+                         #####                  ############ #####    #####
+                        #####                  ############# #####     ####
+                        ####                   ############# #####     #####
+                       ####                   #############  ####       ####
+                       ####                   #############  ####       ####
+                       ####                   ############   ####       ####
+                       #####                  ############   ###        ####
+                        #####                  ##########    ###       #####
+                        #####                  ##########    ##       #####
+                         #####                 #########    ###      #####
+                          #####                 ########    ##      #####
+                           #####                 ######    ##      #####
+                            #####                %####    ##       #####
+                             ####%                ####            #####
+                             #####                ###            #####
+                              #####              ###            #####
+                               #####            ###            #####
+                                #####           ##             #####
+                                 #####                        #####
+                                 #####                       #####
+                                  #####                     #####
+                                   #####                   #####
+                                    ####                   ####
+                                     ###                    ###
+
+
+
+
+
+                         #####     ##     ######  ###   ###  ######  ###   #
+                        ##  ##    ####    ##  ##  ###   ###  ##      ###   #
+                        #%   ##   ####    ##  ##  ####  ###  ##      ####  #
+                       ##         # ##    ##  ##  #### ####  ######  ## ## #
+                       ##        ##  ##   #####   ## # ####  ######  ## ## #
+                        #    ##  ######   ## ##   ## ### ##  ##      ##  ###
+                        ### ##  ##   ##   ##  ##  ## ### ##  ##      ##  ###
+                         #####  ##    ##  ##  ##  ##  ## ##  ######  ##   ##
+"""
@@ -4,7 +4,9 @@ This module handles the registration of FastAPI application, routers, and carbon
 
 from fastapi import FastAPI
 from backend.src.core.settings import settings
+from backend.src.core.yaml_config_loader import get_config
 from backend.src.api.api import api_router
+from backend.src.api.dependencies import close_app_dao
 from backend.src.common.exception_handler import register_exception_handlers
 from backend.src.services.carbon_service.carbon_service import CarbonService
 from backend.src.services.carbon_service.impact_framework.service.if_app_service import (
@@ -26,6 +28,9 @@ def register_app() -> FastAPI:
     Returns:
         FastAPI: The registered FastAPI application.
     """
+    # Loaded eagerly so that a missing or invalid configuration stops the process
+    # at startup, the requests then read the cached configuration
+    get_config()
     app = FastAPI(
         title=settings.FASTAPI.TITLE,
         description=settings.FASTAPI.DESCRIPTION,
@@ -36,6 +41,7 @@ def register_app() -> FastAPI:
     register_router(app)
     register_models()
     register_exception_handlers(app)
+    app.add_event_handler("shutdown", close_app_dao)
 
     return app
 
@@ -11,7 +11,6 @@ from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Any
-import colorlog
 import urllib3
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
@@ -79,8 +78,8 @@ class FinOpsConfig(BaseSettings):
     Configuration class for FinOps settings.
     """
 
-    REPORT_HEADERS: list[list[str]] = [
-        [
+    REPORT_HEADERS: tuple[tuple[str, ...], ...] = (
+        (
             # Common columns
             "Date",
             "ResourceType",
@@ -100,8 +99,8 @@ class FinOpsConfig(BaseSettings):
             "Environment",
             "Partition",
             "Component",
-        ]
-    ]
+        ),
+    )
 
 
 class Settings(BaseSettings):
@@ -122,6 +121,47 @@ class Settings(BaseSettings):
     CARMEN_CONFIG_FILEPATH: str = os.getenv("CARMEN_CONFIG_FILEPATH", "config.yaml")
 
 
+_LEVEL_COLORS: dict[int, str] = {
+    logging.DEBUG: "\x1b[36m",  # cyan
+    logging.INFO: "\x1b[32m",  # green
+    logging.WARNING: "\x1b[33m",  # yellow
+    logging.ERROR: "\x1b[31m",  # red
+    logging.CRITICAL: "\x1b[31m\x1b[47m",  # red on white
+}
+_RESET_COLOR = "\x1b[0m"
+
+
+class ColoredFormatter(logging.Formatter):
+    """
+    Formatter wrapping each record in the ANSI color of its log level.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        color = _LEVEL_COLORS.get(record.levelno)
+        if color is None:
+            return super().format(record)
+        return f"{color}{super().format(record)}{_RESET_COLOR}"
+
+
+def use_colors(handler: logging.StreamHandler) -> bool:
+    """
+    Tells whether the console handler output should be colored.
+
+    As colorlog did, colors are only used on a terminal and when NO_COLOR is not
+    set, so piped, captured and container logs stay free of ANSI escapes.
+
+    Args:
+        handler: The console handler.
+
+    Returns:
+        bool: True if the records of the handler should be colored.
+    """
+    if os.getenv("NO_COLOR"):
+        return False
+    isatty = getattr(handler.stream, "isatty", None)
+    return bool(isatty and isatty())
+
+
 def configure_logger(validated_settings: Settings) -> None:
     """
     Configures the logger based on the provided settings.
@@ -149,20 +189,12 @@ def configure_logger(validated_settings: Settings) -> None:
     log_format = "[%(asctime)s] %(levelname)s:%(name)s:%(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
 
-    # Add console handler with colors
-    console_handler = colorlog.StreamHandler()
-    console_format = "%(log_color)s" + log_format
-    console_formatter = colorlog.ColoredFormatter(
-        console_format,
-        datefmt=date_format,
-        log_colors={
-            "DEBUG": "cyan",
-            "INFO": "green",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "CRITICAL": "red,bg_white",
-        },
+    # Add console handler, with colors on a terminal
+    console_handler = logging.StreamHandler()
+    formatter_class = (
+        ColoredFormatter if use_colors(console_handler) else logging.Formatter
     )
+    console_formatter = formatter_class(log_format, datefmt=date_format)
     console_handler.setFormatter(console_formatter)
     root_logger.addHandler(console_handler)
 
@@ -27,8 +27,18 @@ from backend.src.common.known_exception import (
 )
 from backend.src.core.settings import settings
 
+try:
+    from yaml import CSafeLoader as ConfigLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as ConfigLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+ENV_VAR_PATTERN = re.compile(r"\$\{(\w+)\}")
+AZURE_CREDENTIAL_FIELDS = ("client_id", "client_secret", "tenant_id")
+# Configuration files are a few KB, anything larger than this is rejected
+MAX_CONFIG_FILE_SIZE = 1024 * 1024
+
 
 class Labels(BaseSettings):
     """Configuration for Kubernetes labels used in queries and monitoring."""
@@ -127,13 +137,37 @@ class DaemonConfig(BaseSettings):
     upload: UploadConfig = UploadConfig()
 
     @model_validator(mode="after")
-    def validate_source_configuration(self) -> DaemonConfig:
+    def validate_configuration(self) -> DaemonConfig:
         """
-        Validate source configuration parameters.
+        Validate source and upload configuration parameters.
 
         Returns:
             The validated model.
 
+        Raises:
+            MissingParametersError: If required parameters are missing.
+            ValueError: If the storage account url is not a valid https url.
+        """
+        # Azure credentials are shared between source and upload
+        missing_creds: list[str] = []
+        if self.source.type == "azure" or self.upload.type == "azure":
+            missing_creds = [
+                name
+                for name in AZURE_CREDENTIAL_FIELDS
+                if not getattr(self.credentials, name)
+            ]
+
+        self._validate_source_configuration(missing_creds)
+        self._validate_upload_configuration(missing_creds)
+        return self
+
+    def _validate_source_configuration(self, missing_creds: list[str]) -> None:
+        """
+        Validate source configuration parameters.
+
+        Args:
+            missing_creds: Azure credentials missing from the configuration.
+
         Raises:
             MissingParametersError: If required parameters are missing.
         """
@@ -144,15 +178,6 @@ class DaemonConfig(BaseSettings):
             )
 
         if self.source.type == "azure":
-            # Check Azure credentials
-            missing_creds: list[str] = []
-            if not self.credentials.client_id:
-                missing_creds.append("client_id")
-            if not self.credentials.client_secret:
-                missing_creds.append("client_secret")
-            if not self.credentials.tenant_id:
-                missing_creds.append("tenant_id")
-
             # Check Azure source settings
             missing_source: list[str] = []
             if not self.source.azure.storage_account_url:
@@ -177,29 +202,17 @@ class DaemonConfig(BaseSettings):
                 ErrorCode.CONFIG_MISSING_PARAMETERS, ["source_path"]
             )
 
-        return self
-
-    @model_validator(mode="after")
-    def validate_upload_configuration(self) -> DaemonConfig:
+    def _validate_upload_configuration(self, missing_creds: list[str]) -> None:
         """
         Validate upload configuration parameters.
 
-        Returns:
-            The validated model.
+        Args:
+            missing_creds: Azure credentials missing from the configuration.
 
         Raises:
-            ValueError: If required parameters are missing for the specified upload type.
+            MissingParametersError: If required parameters are missing.
         """
         if self.upload.type == "azure":
-            # Check Azure credentials (shared with source)
-            missing_creds: list[str] = []
-            if not self.credentials.client_id:
-                missing_creds.append("client_id")
-            if not self.credentials.client_secret:
-                missing_creds.append("client_secret")
-            if not self.credentials.tenant_id:
-                missing_creds.append("tenant_id")
-
             # Check Azure upload settings
             missing_upload: list[str] = []
             if not self.upload.azure.container_name_upload:
@@ -216,8 +229,6 @@ class DaemonConfig(BaseSettings):
                 ErrorCode.CONFIG_MISSING_PARAMETERS, ["upload_path"]
             )
 
-        return self
-
     @property
     def source_type(self) -> Literal["azure", "local"]:
         """Backward compatibility for source_type."""
@@ -294,18 +305,10 @@ def env_constructor(loader: yaml.SafeLoader, node: yaml.ScalarNode) -> str:
     Returns:
         The processed string with environment variables substituted.
     """
-    pattern = re.compile(r".*?\${(\w+)}.*?")
     value: str = loader.construct_scalar(node)
-    matches: list[str] = pattern.findall(value)
-
-    if matches:
-        full_value = value
-        for var in matches:
-            env_value: str = os.environ.get(var, var)
-            full_value = full_value.replace(f"${{{var}}}", env_value)
-        return full_value
-
-    return value
+    return ENV_VAR_PATTERN.sub(
+        lambda match: os.environ.get(match.group(1), match.group(1)), value
+    )
 
 
 @lru_cache()
@@ -328,7 +331,11 @@ def load_and_validate_config() -> AppConfig:
         logger.error("Configuration file not found: %s", config_file)
         raise ConfigFileError(ErrorCode.CONFIG_FILE_MISSING, file_path=config_file)
 
-    loader = yaml.SafeLoader
+    if path.stat().st_size > MAX_CONFIG_FILE_SIZE:
+        logger.error("Configuration file is too large: %s", config_file)
+        raise ConfigFileError(ErrorCode.CONFIG_INVALID_FILE, file_path=config_file)
+
+    loader = ConfigLoader
     loader.add_constructor("!env", env_constructor)
 
     try:
@@ -369,31 +376,28 @@ def load_and_validate_config() -> AppConfig:
     return yaml_config
 
 
+@lru_cache(maxsize=1)
 def get_config() -> AppConfig:
     """
     Get the application configuration.
 
-    This function provides a way to access the configuration without
-    directly calling the cached loader function.
+    The configuration file is loaded and validated on the first call rather than
+    at import time, and the process exits if it cannot be loaded. The API makes
+    that first call in register_app, so that a bad configuration fails at startup.
 
     Returns:
         The application configuration object.
-
-    Raises:
-        FileNotFoundError: If the configuration file is not found.
-        ValueError: If there's an error parsing or validating the configuration.
     """
-    return load_and_validate_config()
-
+    try:
+        app_config = load_and_validate_config()
+    except (ConfigFileError, ConfigValidationError, MissingParametersError) as e:
+        logger.error("Failed to load configuration: %s", e.formatted_string)
+        sys.exit(1)
+    except Exception as e:
+        logger.error("Unexpected error during configuration loading: %s", str(e))
+        sys.exit(1)
 
-try:
-    config = load_and_validate_config()
     logger.info(
         "configuration loaded successfully from: %s", settings.CARMEN_CONFIG_FILEPATH
     )
-except (ConfigFileError, ConfigValidationError, MissingParametersError) as e:
-    logger.error("Failed to load configuration: %s", e.formatted_string)
-    sys.exit(1)
-except Exception as e:
-    logger.error("Unexpected error during configuration loading: %s", str(e))
-    sys.exit(1)
+    return app_config
@@ -4,12 +4,41 @@ This module defines the Azure Active Directory authentication strategy.
 
 from __future__ import annotations
 
+import time
+from functools import lru_cache
+
 from msal import ConfidentialClientApplication
 
 from backend.src.core.yaml_config_loader import ApiConfig
 from backend.src.crud.auth_strategies.auth_strategy import AuthStrategy
 
 
+# Renew the token this many seconds before it actually expires
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+
+@lru_cache(maxsize=8)
+def _msal_app(
+    client_id: str, client_secret: str, tenant_id: str
+) -> ConfidentialClientApplication:
+    """
+    Get the MSAL application for a set of credentials, building it only once.
+
+    Args:
+        client_id: The client id of the application registration.
+        client_secret: The client secret of the application registration.
+        tenant_id: The Azure tenant id.
+
+    Returns:
+        ConfidentialClientApplication: The shared MSAL application.
+    """
+    return ConfidentialClientApplication(
+        client_id=client_id,
+        client_credential=client_secret,
+        authority=f"https://login.microsoftonline.com/{tenant_id}",
+    )
+
+
 class AAD(AuthStrategy):
     """
     AAD Authentication Strategy for Thanos queries.
@@ -20,22 +49,41 @@ class AAD(AuthStrategy):
         Initialize the AAD auth_strategies strategy.
         """
         assert config.credentials is not None
-        self.app: ConfidentialClientApplication = ConfidentialClientApplication(
-            client_id=str(config.credentials.client_id),
-            client_credential=str(config.credentials.client_secret),
-            authority=f"https://login.microsoftonline.com/{str(config.credentials.tenant_id)}",
+        self.app: ConfidentialClientApplication = _msal_app(
+            str(config.credentials.client_id),
+            str(config.credentials.client_secret),
+            str(config.credentials.tenant_id),
         )
         self.scope: str = str(config.scope)
+        self._headers: dict[str, str] | None = None
+        self._headers_expire_at: float = 0.0
 
     def get_headers(self) -> dict[str, str]:
         """
         Get the headers for the request, including the AAD token.
 
+        The headers are reused until the token is about to expire.
+
         Returns:
             dict: The headers for the request.
         """
+        if self._headers is not None and time.monotonic() < self._headers_expire_at:
+            return self._headers
+
         result = self.app.acquire_token_for_client([self.scope])
         if result and "access_token" in result:
             token: str = str(result["access_token"])
-            return {"Authorization": f"Bearer {token}"}
+            self._headers = {"Authorization": f"Bearer {token}"}
+            self._headers_expire_at = (
+                time.monotonic()
+                + int(result.get("expires_in", 0))
+                - TOKEN_EXPIRY_MARGIN_SECONDS
+            )
+            return self._headers
         raise ValueError(result)
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached headers so that the next call acquires a token again.
+        """
+        self._headers = None
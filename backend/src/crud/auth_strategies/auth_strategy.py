@@ -17,3 +17,9 @@ class AuthStrategy(ABC):
         """
         Get the headers for the request, including any necessary authentication tokens.
         """
+
+    def invalidate(self) -> None:
+        """
+        Drop any cached credentials so that the next call to get_headers
+        fetches new ones.
+        """
@@ -6,6 +6,9 @@ from __future__ import annotations
 
 from backend.src.crud.auth_strategies.auth_strategy import AuthStrategy
 
+# Shared by every call, must not be mutated by callers
+_NO_HEADERS: dict[str, str] = {}
+
 
 class NoAuth(AuthStrategy):
     """
@@ -18,6 +21,6 @@ class NoAuth(AuthStrategy):
         Returns an empty dictionary as no authentication headers are needed.
 
         Returns:
-            dict: An empty dictionary.
+            dict: A shared empty dictionary, which must not be mutated.
         """
-        return {}
+        return _NO_HEADERS
@@ -6,6 +6,7 @@ It handles auth_strategies, token refreshing, and executing queries to Thanos en
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from datetime import datetime
@@ -24,6 +25,18 @@ from backend.src.core.yaml_config_loader import ApiConfig
 
 logger = logging.getLogger(__name__)
 
+# Upper bound of queries sent to Thanos at the same time by exec_queries
+MAX_CONCURRENT_QUERIES = 16
+
+
+def _format_timestamp(moment: datetime) -> str:
+    """
+    Format a datetime as the RFC 3339 timestamp expected by Thanos.
+
+    Any timezone information is ignored, the wall-clock time is sent as UTC.
+    """
+    return f"{moment.replace(tzinfo=None).isoformat(timespec='seconds')}.000Z"
+
 
 class CrudThanosApp:
     """
@@ -50,8 +63,8 @@ class CrudThanosApp:
         """
         self.thanos_url = thanos_url
         self.auth_strategy = auth_strategy
-        self.headers = self.auth_strategy.get_headers()
         self.verify_ssl = verify_ssl
+        self._client: httpx.AsyncClient | None = None
 
         if not verify_ssl:
             logger.warning(
@@ -59,6 +72,31 @@ class CrudThanosApp:
                 "This is insecure and should only be used in development environments."
             )
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        HTTP client shared by all Thanos queries, created on first use so that
+        connections are kept alive between queries.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(verify=self.verify_ssl, timeout=200.0)
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the shared HTTP client and its pooled connections.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """
+        Authorization headers provided by the authentication strategy.
+        """
+        return self.auth_strategy.get_headers()
+
     # FIX: Pylint #R0913
     async def exec_query(
         self,
@@ -99,9 +137,10 @@ class CrudThanosApp:
             "Executing the query to Thanos with the following parameters: query: %s"
         )
         if start is not None and end is not None:
-            params["start"] = start.strftime("%Y-%m-%dT%H:%M:%S.000Z")
-            params["end"] = end.strftime("%Y-%m-%dT%H:%M:%S.000Z")
-            params["step"] = sampling_rate.value
+            params["start"] = _format_timestamp(start)
+            params["end"] = _format_timestamp(end)
+            if sampling_rate is not None:
+                params["step"] = str(sampling_rate)
             logger.debug(
                 "%s, start: %s, end: %s, sampling_rate: %s",
                 debug_msg,
@@ -116,14 +155,11 @@ class CrudThanosApp:
 
         async def make_request() -> httpx.Response:
             try:
-                async with httpx.AsyncClient(
-                    verify=self.verify_ssl, timeout=200.0
-                ) as client:
-                    return await client.get(
-                        endpoint,
-                        headers=self.headers,
-                        params=params,
-                    )
+                return await self.client.get(
+                    endpoint,
+                    headers=self.headers,
+                    params=params,
+                )
             except httpx.TimeoutException as e:
                 logger.error("Thanos query timed out: %s", str(e))
                 raise ThanosError(
@@ -159,7 +195,7 @@ class CrudThanosApp:
                     retry_attempts,
                 )
                 try:
-                    self.headers = self.auth_strategy.get_headers()
+                    self.auth_strategy.invalidate()
                     response = await make_request()
                 except Exception as e:
                     logger.error("Failed to refresh token: %s", str(e))
@@ -194,3 +230,40 @@ class CrudThanosApp:
                 query=query,
                 details=f"Response parsing failed: {str(e)}",
             ) from e
+
+    async def exec_queries(
+        self,
+        queries: list[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        sampling_rate: SamplingRate | None = None,
+        time_series: bool = True,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Execute several prometheus queries sharing the same time range concurrently.
+
+        At most MAX_CONCURRENT_QUERIES queries are in flight at the same time.
+
+        Args:
+            queries: The queries to execute (PromQL).
+            start: The start time for the queries. Defaults to None.
+            end: The end time for the queries. Defaults to None.
+            sampling_rate: The time sampling_rate for the queries. Defaults to None.
+            time_series: Flag to indicate whether the queries are time-series queries.
+
+        Returns:
+            list: The responses from Thanos API, in the order of the queries.
+
+        Raises:
+            ThanosError: If the execution of any query fails.
+            TokenError: If authentication token refresh fails.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+
+        async def run(query: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self.exec_query(
+                    query, start, end, sampling_rate, time_series
+                )
+
+        return list(await asyncio.gather(*(run(query) for query in queries)))
@@ -13,11 +13,11 @@ import time
 from enum import Enum
 from typing import Protocol, runtime_checkable
 
-from backend.src.common.constants import CARMEN_LOGO
+from backend.src.common.logo import CARMEN_LOGO
 from backend.src.common.errors import ErrorCode
 from backend.src.common.known_exception import KnownException
 from backend.src.core.registrar import register_models
-from backend.src.core.yaml_config_loader import DaemonConfig, config
+from backend.src.core.yaml_config_loader import DaemonConfig, get_config
 from backend.src.daemon.readers.compute.azure_compute_reader import (
     AzureComputeReaderStrategy,
 )
@@ -318,7 +318,7 @@ def main() -> None:
     """
     try:
         logger.info(CARMEN_LOGO)
-        daemon = CarbonDaemon(config.carmen_daemon)
+        daemon = CarbonDaemon(get_config().carmen_daemon)
         result = daemon.run()
 
         if not result.success:
@@ -26,10 +26,7 @@ def calculate_vm_count_for_missing_regions(
     def get_vms() -> list
     """
     if region not in REGION_TO_COUNTRY_CARBON_INTENSITY:
-        if region not in missing_region_vm_count:
-            missing_region_vm_count[region] = 1
-        else:
-            missing_region_vm_count[region] += 1
+        missing_region_vm_count[region] = missing_region_vm_count.get(region, 0) + 1
 
 
 def log_missing_regions(missing_region_vm_count: dict[str, int]):
@@ -48,25 +45,31 @@ def log_missing_regions(missing_region_vm_count: dict[str, int]):
         )
 
 
+def _empty_if_dash(value: str) -> str:
+    """
+    Returns an empty string for the "-" placeholder used in the FinOps exports.
+    """
+    return "" if value == "-" else value
+
+
 def create_vm(row: dict[str, str], vm_id: str, vm_size: str) -> VirtualMachine:
     """
     Creates a new VirtualMachine instance based on the provided row data.
     """
+    region = row["Region"]
     return VirtualMachine(
         id=vm_id,
-        region=row["Region"],
+        region=region,
         vm_size=vm_size,
-        service=row["Service"] if row["Service"] != "-" else "",
-        component=row["Component"] if row["Component"] != "-" else "",
-        subscription=(row["Subscription"] if row["Subscription"] != "-" else ""),
+        service=_empty_if_dash(row["Service"]),
+        component=_empty_if_dash(row["Component"]),
+        subscription=_empty_if_dash(row["Subscription"]),
         name=row["Name"],
-        instance=row["Instance"] if row["Instance"] != "-" else "",
-        environment=row["Environment"] if row["Environment"] != "-" else "",
-        partition=row["Partition"] if row["Partition"] != "-" else "",
+        instance=_empty_if_dash(row["Instance"]),
+        environment=_empty_if_dash(row["Environment"]),
+        partition=_empty_if_dash(row["Partition"]),
         carbon_intensity=PaasCiMapper.calculate_ci(
-            row["Region"]
-            if row["Region"] != "-" and row["Region"]
-            else "germanywestcentral"
+            _empty_if_dash(region) or "germanywestcentral"
         ),
         pue=PUE_AZURE,  # improvement: add pue value dynamically
     )
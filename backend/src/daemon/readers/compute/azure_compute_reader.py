@@ -2,7 +2,11 @@
 Azure reader strategy for processing virtual machine data from Azure Blob Storage.
 """
 
+import io
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from azure.core.exceptions import ResourceNotFoundError
 from azure.identity import ClientSecretCredential
 from azure.storage.blob import ContainerClient, BlobClient
@@ -18,6 +22,9 @@ from backend.src.utils.azure_utils import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the number of blobs downloaded at the same time
+MAX_DOWNLOAD_WORKERS = 32
+
 
 class AzureComputeReaderStrategy(Reader):
     """
@@ -114,32 +121,55 @@ class AzureComputeReaderStrategy(Reader):
         """
         total_files = len(self.file_names)
         logger.info("processing %d blob files", total_files)
+        if not total_files:
+            return
+
+        # Downloads are I/O bound and run in parallel; the CSV data is still
+        # processed on this thread, in file order, as vm_dict is not shared safely.
+        # At most max_workers blobs are downloaded ahead of the one being processed,
+        # which bounds the memory held by the downloaded data
+        max_workers = min(MAX_DOWNLOAD_WORKERS, total_files)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            download = partial(
+                executor.submit, self._download_blob_data, container_client
+            )
+            downloads: deque[Future[io.StringIO | None]] = deque(
+                download(blob_path) for blob_path in self.file_names[:max_workers]
+            )
 
-        for index, blob_path in enumerate(self.file_names, 1):
-            logger.debug("processing file %d/%d %s", index, total_files, str(blob_path))
-
-            try:
-                blob_data = self._download_blob_data(container_client, str(blob_path))
-                if blob_data is None:
+            for index, blob_path in enumerate(self.file_names, 1):
+                blob_data = downloads.popleft().result()
+                if index + max_workers <= total_files:
+                    downloads.append(download(self.file_names[index + max_workers - 1]))
+                logger.debug("processing file %d/%d %s", index, total_files, blob_path)
+
+                try:
+                    if blob_data is None:
+                        missing_blobs.add(blob_path)
+                        continue
+
+                    # Closing the stream releases the blob data once it is parsed
+                    with blob_data:
+                        has_data = self.process_csv_file(
+                            blob_data, vm_dict, missing_region_vm_count
+                        )
+
+                    if not has_data:
+                        logger.warning(
+                            "empty or invalid csv data in file %s", blob_path
+                        )
+                    else:
+                        logger.debug("successfully processed file %s", blob_path)
+
+                except Exception as e:
+                    logger.error(
+                        "unexpected error processing file %s %s", blob_path, str(e)
+                    )
                     missing_blobs.add(blob_path)
-                    continue
-
-                if not self.process_csv_data(
-                    blob_data, vm_dict, missing_region_vm_count
-                ):
-                    logger.warning("empty or invalid csv data in file %s", blob_path)
-                else:
-                    logger.debug("successfully processed file %s", blob_path)
-
-            except Exception as e:
-                logger.error(
-                    "unexpected error processing file %s %s", blob_path, str(e)
-                )
-                missing_blobs.add(blob_path)
 
     def _download_blob_data(
         self, container_client: ContainerClient, blob_path: str
-    ) -> str | None:
+    ) -> io.StringIO | None:
         """
         Download blob data from Azure storage.
 
@@ -148,21 +178,20 @@ class AzureComputeReaderStrategy(Reader):
             blob_path: Path to the blob file.
 
         Returns:
-            Blob data as string, or None if blob not found or decode failed.
+            Text stream over the blob data, or None if blob not found or decode failed.
         """
         try:
             logger.debug("attempting to download blob %s", blob_path)
             blob_client: BlobClient = container_client.get_blob_client(blob_path)
 
-            if not blob_client.exists():
-                logger.warning("blob does not exist %s", blob_path)
-                return None
-
-            blob_data: str = blob_client.download_blob().readall().decode("utf-8")  # type: ignore[misc]
+            # A missing blob raises ResourceNotFoundError, no need for a HEAD request
+            blob_bytes: bytes = blob_client.download_blob().readall()  # type: ignore[assignment]
             logger.debug(
-                "successfully downloaded blob %s %d bytes", blob_path, len(blob_data)
+                "successfully downloaded blob %s %d bytes", blob_path, len(blob_bytes)
             )
-            return blob_data
+            # Decoded up front so that an invalid blob is rejected as a whole,
+            # before any of its rows reach the VM dictionary
+            return io.StringIO(blob_bytes.decode("utf-8"), newline="")
 
         except ResourceNotFoundError:
             logger.warning("blob file not found %s", blob_path)
@@ -5,6 +5,8 @@ Base module for reading and processing compute resource data.
 import csv
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import NamedTuple
 from pydantic import ValidationError
 from backend.src.core.yaml_config_loader import DaemonConfig
 from backend.src.daemon.daemon_helpers import (
@@ -12,11 +14,43 @@ from backend.src.daemon.daemon_helpers import (
     create_vm,
 )
 from backend.src.schemas.virtual_machine import VirtualMachine
-from backend.src.utils.helpers import str_to_float
 
 logger = logging.getLogger(__name__)
 
 
+class _CsvColumns(NamedTuple):
+    """
+    Positions of the columns read from the compute CSV rows.
+    """
+
+    id: int
+    size: int
+    region: int
+    cpu: int
+    time: int
+    disk: int
+
+    @classmethod
+    def from_header(cls, header: list[str]) -> "_CsvColumns":
+        """
+        Resolves the column positions from the CSV header row.
+
+        Args:
+            header (list[str]): The CSV header row.
+        Returns:
+            _CsvColumns: The positions of the columns used to build the VMs.
+        """
+        columns = {name: index for index, name in enumerate(header)}
+        return cls(
+            id=columns["Id"],
+            size=columns["Size"],
+            region=columns["Region"],
+            cpu=columns["AverageCpuPercentage"],
+            time=columns["Time"],
+            disk=columns["DiskSizeGb"],
+        )
+
+
 class Reader(ABC):
     """
     Abstract base class for reading compute resource data from various sources.
@@ -34,9 +68,61 @@ class Reader(ABC):
             list[VirtualMachine]: List of virtual machines extracted from the data source.
         """
 
+    def process_csv_file(
+        self,
+        csv_data: Iterable[str],
+        vm_dict: dict[str, VirtualMachine],
+        missing_region_vm_count: dict[str, int],
+    ) -> bool:
+        """
+        Processes the CSV data of one file, which is either applied as a whole or not at all.
+
+        If the file fails part way through, e.g. on a decode or validation error, the rows
+        already read from it are rolled back before the error is raised again.
+
+        Args:
+            csv_data (Iterable[str]): The CSV lines, usually a text stream opened on the file or blob.
+            vm_dict (Dict[str, VirtualMachine]): The dictionary containing VirtualMachine objects, indexed by their ID.
+            missing_region_vm_count (Dict[str, int]): Dictionary with the information of missing regions and
+            the corresponding VM count.
+        Returns:
+            bool: The result of process_csv_data.
+        """
+        # The three series of a VM always have the same length between files
+        series_lengths = {vm_id: len(vm.time_points) for vm_id, vm in vm_dict.items()}
+        missing_regions = dict(missing_region_vm_count)
+        try:
+            return self.process_csv_data(csv_data, vm_dict, missing_region_vm_count)
+        except Exception:
+            self._rollback_vms(vm_dict, series_lengths)
+            missing_region_vm_count.clear()
+            missing_region_vm_count.update(missing_regions)
+            raise
+
+    @staticmethod
+    def _rollback_vms(
+        vm_dict: dict[str, VirtualMachine], series_lengths: dict[str, int]
+    ) -> None:
+        """
+        Restores the virtual machine dictionary to the series lengths it had before a file.
+
+        Args:
+            vm_dict (Dict[str, VirtualMachine]): The dictionary containing VirtualMachine objects, indexed by their ID.
+            series_lengths (Dict[str, int]): The series length of each VM before the file.
+        """
+        for vm_id in list(vm_dict):
+            length = series_lengths.get(vm_id)
+            if length is None:
+                del vm_dict[vm_id]
+                continue
+            vm = vm_dict[vm_id]
+            del vm.cpu_util[length:]
+            del vm.time_points[length:]
+            del vm.storage_size[length:]
+
     def process_csv_data(
         self,
-        blob_data: str,
+        csv_data: Iterable[str],
         vm_dict: dict[str, VirtualMachine],
         missing_region_vm_count: dict[str, int],
     ) -> bool:
@@ -46,34 +132,52 @@ class Reader(ABC):
         Args:
             missing_region_vm_count (Dict[str, int]): Dictionary with the information of missing regions and
             the corresponding VM count.
-            blob_data (str): The CSV data read from the blob, as a string.
+            csv_data (Iterable[str]): The CSV lines, usually a text stream opened on the file or blob.
             vm_dict (Dict[str, VirtualMachine]): The dictionary containing VirtualMachine objects, indexed by their ID.
         Returns:
             bool: Returns True if the CSV data is processed successfully and contains data,
             False if the CSV data is empty (excluding the header row).
         """
-        rows = blob_data.splitlines()
-        if len(rows) == 1:
+        csv_reader = csv.reader(csv_data)
+        header = next(csv_reader, None)
+        if header is None:
             return False
-        csv_reader = csv.DictReader(rows)
+
+        # Resolve the column positions once instead of hashing names on every row
+        columns = _CsvColumns.from_header(header)
+
+        has_rows = False
         for row in csv_reader:
-            vm_size = row["Size"]
-            vm_id = row["Id"]
+            if not row:
+                # Blank lines, as skipped by csv.DictReader
+                continue
+            if len(row) < len(header):
+                logger.warning(
+                    "skipping truncated csv row at line %d %s",
+                    csv_reader.line_num,
+                    row,
+                )
+                continue
+            has_rows = True
+            vm_size = row[columns.size]
+            vm_id = row[columns.id]
             try:
-                if vm_id not in vm_dict:
+                vm = vm_dict.get(vm_id)
+                if vm is None:
                     calculate_vm_count_for_missing_regions(
-                        missing_region_vm_count, row["Region"]
+                        missing_region_vm_count, row[columns.region]
                     )
-                    new_vm = create_vm(row, vm_id, vm_size)
-                    vm_dict[vm_id] = new_vm
+                    vm = create_vm(dict(zip(header, row)), vm_id, vm_size)
+                    vm_dict[vm_id] = vm
 
-                vm_dict[vm_id].cpu_util.append(
-                    str_to_float(row["AverageCpuPercentage"]) / 100
-                )
-                vm_dict[vm_id].time_points.append(row["Time"])
-                vm_dict[vm_id].storage_size.append(str_to_float(row["DiskSizeGb"]))
+                # Inlined str_to_float, called twice for every row
+                cpu = row[columns.cpu]
+                disk = row[columns.disk]
+                vm.cpu_util.append(float(cpu) / 100 if cpu else 0.0)
+                vm.time_points.append(row[columns.time])
+                vm.storage_size.append(float(disk) if disk else 0.0)
             except ValidationError:
                 logger.exception("Validation error for VM %s", vm_id)
                 raise
 
-        return True
+        return has_rows
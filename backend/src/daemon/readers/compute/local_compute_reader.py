@@ -4,6 +4,7 @@ Local filesystem reader strategy for processing virtual machine data from local
 
 import logging
 from pathlib import Path
+from typing import TextIO
 
 from backend.src.common.errors import ErrorCode
 from backend.src.common.known_exception import KnownException
@@ -105,28 +106,37 @@ class LocalComputeReaderStrategy(Reader):
                     missing_files.add(file_name)
                     continue
 
-                if not self.process_csv_data(
-                    file_data, vm_dict, missing_region_vm_count
-                ):
+                # The file is decoded while it is parsed, a decode error part way
+                # through rolls back the rows already read from it
+                with file_data:
+                    has_data = self.process_csv_file(
+                        file_data, vm_dict, missing_region_vm_count
+                    )
+
+                if not has_data:
                     logger.warning("empty or invalid csv data in file %s", file_name)
                 else:
                     logger.debug("successfully processed file %s", file_name)
 
+            except UnicodeDecodeError as e:
+                logger.error("failed to decode file data for %s %s", file_path, str(e))
+                missing_files.add(file_name)
             except Exception as e:
                 logger.error(
                     "unexpected error processing file %s %s", file_name, str(e)
                 )
                 missing_files.add(file_name)
 
-    def _read_file_data(self, file_path: Path) -> str | None:
+    def _read_file_data(self, file_path: Path) -> TextIO | None:
         """
-        Read file data from local filesystem.
+        Open a file from local filesystem for reading.
 
         Args:
             file_path: Path to the file.
 
         Returns:
-            File data as string, or None if file not found or read failed.
+            Text stream over the file, to be closed by the caller, or None if
+            file not found.
         """
         try:
             logger.debug("attempting to read file %s", file_path)
@@ -139,12 +149,10 @@ class LocalComputeReaderStrategy(Reader):
                 logger.warning("path is not a file %s", file_path)
                 return None
 
-            with file_path.open("r", encoding="utf-8") as file:
-                file_data = file.read()
+            # The CSV is parsed straight from the stream, without reading it whole
+            file_data = file_path.open("r", encoding="utf-8", newline="")
 
-            logger.debug(
-                "successfully read file %s %d bytes", file_path, len(file_data)
-            )
+            logger.debug("successfully opened file %s", file_path)
             return file_data
 
         except FileNotFoundError:
@@ -156,9 +164,6 @@ class LocalComputeReaderStrategy(Reader):
                 ErrorCode.FILE_PERMISSION_DENIED,
                 details=f"permission denied: {file_path}",
             ) from e
-        except UnicodeDecodeError as e:
-            logger.error("failed to decode file data for %s %s", file_path, str(e))
-            return None
         except Exception as e:
             logger.error("unexpected error reading file %s %s", file_path, str(e))
             raise KnownException(
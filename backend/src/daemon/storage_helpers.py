@@ -5,6 +5,7 @@ Storage processing helper functions
 from __future__ import annotations
 
 import csv
+import io
 import re
 import logging
 from datetime import datetime
@@ -15,20 +16,22 @@ from backend.src.schemas.storage_resource import StorageResource
 
 logger = logging.getLogger(__name__)
 
+# Pattern to capture SKUs: P15, S4, E10, etc.
+SKU_PATTERN = re.compile(r"\b([PES]\d+)\b")
+
 
 def calculate_billing_period_days(csv_data: str) -> int:
     """
     Calculate billing period days dynamically from CSV BillingPeriodStartDate and BillingPeriodEndDate.
     Format: 4/1/2025 4/30/2025
     """
-    rows = csv_data.splitlines()
-    if len(rows) <= 1:
-        logger.error("CSV error, defaulting period size to 30 days")
-        return 30  # Default fallback
-
-    csv_reader = csv.DictReader(rows)
+    # Only the first rows are usually needed, so read them lazily instead of
+    # splitting the whole export into lines
+    csv_reader = csv.DictReader(io.StringIO(csv_data, newline=""))
 
+    has_rows = False
     for row in csv_reader:
+        has_rows = True
         start_date_str = row.get("BillingPeriodStartDate", "")
         end_date_str = row.get("BillingPeriodEndDate", "")
 
@@ -60,6 +63,10 @@ def calculate_billing_period_days(csv_data: str) -> int:
                 )
                 continue
 
+    if not has_rows:
+        logger.error("CSV error, defaulting period size to 30 days")
+        return 30  # Default fallback
+
     logger.warning("Could not determine billing period from CSV, using default 30 days")
     return 30
 
@@ -138,13 +145,10 @@ def extract_size_from_product_name(product_name: str) -> float:
     Returns:
         float: Size in GB, 0.0 if not found
     """
-    # Pattern to capture SKUs: P15, S4, E10, etc.
-    sku_pattern = r"\b([PES]\d+)\b"
-    matches = re.findall(sku_pattern, product_name.upper())
-
-    for match in matches:
-        if match in DISK_SKU_SIZE_MAPPING:
-            return float(DISK_SKU_SIZE_MAPPING[match])
+    for match in SKU_PATTERN.finditer(product_name.upper()):
+        sku_size = DISK_SKU_SIZE_MAPPING.get(match.group(1))
+        if sku_size is not None:
+            return float(sku_size)
 
     return 0.0
 
@@ -290,7 +294,9 @@ def process_storage_row(
         )
 
     # Add temporal data
-    timestamp = row.get("Date", datetime.now().strftime("%Y-%m-%d"))
+    timestamp = row.get("Date")
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y-%m-%d")
     storage_dict[storage_id].time_points.append(timestamp)
 
     # Region validation
@@ -7,7 +7,7 @@ import logging
 import uvicorn
 from fastapi import FastAPI
 
-from backend.src.common.constants import CARMEN_LOGO
+from backend.src.common.logo import CARMEN_LOGO
 from backend.src.common.known_exception import KnownException
 from backend.src.core.registrar import register_app
 from backend.src.core.settings import settings
@@ -16,7 +16,8 @@ import numpy as np
 from backend.src.common.constants import PUE_AZURE
 from backend.src.schemas.application import Application
 from backend.src.schemas.cluster import Cluster
-from backend.src.api.dependencies import AppDao
+from backend.src.api.dependencies import shared_app_dao
+from backend.src.crud.crud_thanos_app import CrudThanosApp
 from backend.src.common.enums import Label, HardwareConsumptionType, SamplingRate
 from backend.src.schemas.compute_resource import ComputeResource
 from backend.src.utils.paas_ci_mapper import PaasCiMapper
@@ -29,7 +30,7 @@ from backend.src.schemas.pod import Pod
 from backend.src.common.errors import ErrorCode
 from backend.src.common.known_exception import DataFetchError
 from backend.src.crud.prometheus_query_builder import PromQBuilder
-from backend.src.core.yaml_config_loader import config
+from backend.src.core.yaml_config_loader import get_config
 from backend.src.core.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -42,9 +43,17 @@ class ArgosService:
     Service class to interact with Thanos for retrieving app pods and related data.
     """
 
-    def __init__(self) -> None:
-        self.external_labels = config.carmen_api.external_labels
-        self.labels = config.carmen_api.labels
+    def __init__(self, app_dao: CrudThanosApp | None = None) -> None:
+        """
+        Initializes the service with the DAO used to query Thanos.
+
+        Args:
+            app_dao: The Thanos DAO, defaults to the process-wide instance.
+        """
+        self.app_dao = app_dao or shared_app_dao()
+        api_config = get_config().carmen_api
+        self.external_labels = api_config.external_labels
+        self.labels = api_config.labels
         self.resource_label_value = lambda resources: (
             "|".join(resources) if resources else ".*"
         )
@@ -66,7 +75,7 @@ class ArgosService:
             .group_by(compute_resource_label)
             .build()
         )
-        response = await AppDao.exec_query(query, time_series=False)
+        response = await self.app_dao.exec_query(query, time_series=False)
         compute_resources = return_desired_metric_from_response(
             response, compute_resource_label
         )
@@ -167,19 +176,22 @@ class ArgosService:
         for cluster_group in clusters:
             logger.info("Retrieving data for cluster(s): %s", cluster_group)
             try:
-                for query, consumption_type in tasks:
-                    pod_data = await AppDao.exec_query(
-                        query(applications, cluster_group, namespaces),
-                        interval_start,
-                        interval_end,
-                        sampling_rate.value,
-                    )
+                tasks_data = await self.app_dao.exec_queries(
+                    [
+                        query(applications, cluster_group, namespaces)
+                        for query, _ in tasks
+                    ],
+                    interval_start,
+                    interval_end,
+                    sampling_rate,
+                )
+                for (_, consumption_type), pod_data in zip(tasks, tasks_data):
                     logger.info(
                         "Parsing %s pod data. Number of data points: %d",
                         consumption_type.value,
                         len(pod_data),
                     )
-                    interp_pod_telemetries = await ArgosService().parse_pod_data(
+                    interp_pod_telemetries = await self.parse_pod_data(
                         pod_data,
                         interp_pod_telemetries,
                         desired_timestamps,
@@ -248,6 +260,7 @@ class ArgosService:
             Dict[str, Pod]: Parsed pods.
         """
 
+        desired_epochs = ArgosService.to_epoch_seconds(desired_timestamps)
         for data in pod_data:
             uid = data["metric"][Label.UID.value]
             app = data["metric"][self.labels.app_label]
@@ -275,7 +288,7 @@ class ArgosService:
             if len(time_points) < len(desired_timestamps):
                 # apply interpolation
                 values_list = ArgosService.interpolate_field_data(
-                    desired_timestamps,
+                    desired_epochs,
                     np.array(time_points),
                     np.array(values_list),
                 )
@@ -291,27 +304,40 @@ class ArgosService:
 
         return pod_telemetries
 
+    @staticmethod
+    def to_epoch_seconds(timestamps: list[datetime]) -> np.ndarray:
+        """
+        Converts the desired timestamps to the epoch seconds used by Thanos.
+
+        Args:
+            timestamps: A list of datetime objects.
+
+        Returns:
+            A numpy array of epoch seconds.
+        """
+        # UTC+1 timezone
+        return np.array([(t + timedelta(hours=1)).timestamp() for t in timestamps])
+
     @staticmethod
     def interpolate_field_data(
-        desired_ts: list[datetime], pod_ts: np.ndarray, values: np.array
+        desired_ts: list[datetime] | np.ndarray, pod_ts: np.ndarray, values: np.array
     ) -> list[float]:
         """
         Interpolates the data for a specific field of a pod onto new timestamps.
 
         Args:
             values: The hardware values to interpolate (e.g., 'requested_cpu').
-            desired_ts: A numpy array of the desired timepoints (timestamps).
+            desired_ts: The desired timepoints, as datetimes or as epoch seconds
+                already converted with to_epoch_seconds.
             pod_ts: A numpy array of the pod's original timepoints (timestamps).
 
         Returns:
             A numpy array of interpolated values.
         """
-        # UTC+1 timezone
-        desired_ts_float = np.array(
-            [(t + timedelta(hours=1)).timestamp() for t in desired_ts]
-        )
+        if not isinstance(desired_ts, np.ndarray):
+            desired_ts = ArgosService.to_epoch_seconds(desired_ts)
 
-        return np.interp(desired_ts_float, pod_ts, values).tolist()
+        return np.interp(desired_ts, pod_ts, values).tolist()
 
     @staticmethod
     def split_pods_by_resource(
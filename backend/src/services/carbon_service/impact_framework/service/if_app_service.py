@@ -54,10 +54,14 @@ class IFAppService(IFService):
             namespace at pod level.
         """
 
-        self.run_if(compute_resources)
-        output = self.parse_if_output(
-            compute_resources, emission_breakdown_at_pod_level
-        )
+        run_id = self.new_run_id()
+        try:
+            self.run_if(compute_resources, run_id=run_id)
+            output = self.parse_if_output(
+                compute_resources, emission_breakdown_at_pod_level, run_id=run_id
+            )
+        finally:
+            self.remove_if_files(0, run_id)
         return output
 
     def get_resource_data(self, data, compute_resources: List[Application]):
@@ -6,6 +6,8 @@ import os
 import logging
 import time
 import copy
+import uuid
+from contextlib import suppress
 from abc import ABC
 from typing import List, Dict, Any, Tuple
 from collections import defaultdict
@@ -55,6 +57,14 @@ from backend.src.utils.metrics_mapper import MetricsMapper
 logger = logging.getLogger(__name__)
 
 
+def _file_suffix(file_id: int, run_id: str = "") -> str:
+    """
+    Returns the part of an IF file name identifying the run and the file.
+    The run id keeps concurrent runs of the shared service instances apart.
+    """
+    return f"_{run_id}_{file_id}" if run_id else str(file_id)
+
+
 class IFService(ABC, CarbonService):
     """
     This abstract class defines the methods that should be implemented by IFApp and IFVM service classes
@@ -75,14 +85,14 @@ class IFService(ABC, CarbonService):
         self.data["aggregation_type"] = aggregation_type
         self.data["duration"] = duration
 
-    def write_if_input(self, data, file_id: int):
+    def write_if_input(self, data, file_id: int, run_id: str = ""):
         """
         Writes IF input yaml file.
         """
 
         try:
             with open(
-                self.INFILE_PATH + str(file_id) + self.FILE_EXTENSION,
+                self.INFILE_PATH + _file_suffix(file_id, run_id) + self.FILE_EXTENSION,
                 mode="w",
                 encoding="utf-8",
             ) as out_file:
@@ -103,13 +113,14 @@ class IFService(ABC, CarbonService):
             logger.exception("YAML parsing error for template file ID %s", file_id)
             raise
 
-    def run_command_in_shell(self, file_id):
+    def run_command_in_shell(self, file_id, run_id: str = ""):
         """
         Runs IF in shell.
         """
+        suffix = _file_suffix(file_id, run_id)
         cmd = (
-            f'npx if-run --manifest "{self.INFILE_PATH}{file_id}{self.FILE_EXTENSION}" '
-            f'--output "{self.OUTFILE_PATH}{file_id}{self.FILE_EXTENSION}"'
+            f'npx if-run --manifest "{self.INFILE_PATH}{suffix}{self.FILE_EXTENSION}" '
+            f'--output "{self.OUTFILE_PATH}{suffix}{self.FILE_EXTENSION}"'
         )
 
         logger.info("Impact Framework command: %s", cmd)
@@ -121,7 +132,12 @@ class IFService(ABC, CarbonService):
             logger.error("%s: %s", error_msg, cmd)
             raise ValueError(error_msg)
 
-    def run_if(self, compute_resources: List[ComputeResource], file_id: int = 0):
+    def run_if(
+        self,
+        compute_resources: List[ComputeResource],
+        file_id: int = 0,
+        run_id: str = "",
+    ):
         """
         Executes the Impact Framework (IF) process for the given compute resources.
 
@@ -131,6 +147,8 @@ class IFService(ABC, CarbonService):
         Args:
             compute_resources (List[ComputeResource]): A list of compute resources (e.g., VMs or pods)
                                                        to be processed by the IF service.
+            file_id (int): Index of the file within the run.
+            run_id (str): Id of the run, see new_run_id.
         """
         logger.info(
             "Generating Impact Framework input file %d for %d resources...",
@@ -140,20 +158,58 @@ class IFService(ABC, CarbonService):
         data = copy.deepcopy(self.data)
         self.fill_parser_data(data, compute_resources)
         start = time.time()
-        self.write_if_input(data, file_id)
+        self.write_if_input(data, file_id, run_id)
         logger.info(
             "Impact Framework input %d generated in %d seconds.",
             file_id,
             round(time.time() - start),
         )
         start = time.time()
-        self.run_command_in_shell(file_id)
+        self.run_command_in_shell(file_id, run_id)
         logger.info(
             "Impact Framework completed the CO2 computation for file %d in %d seconds.",
             file_id,
             round(time.time() - start),
         )
 
+    @staticmethod
+    def new_run_id() -> str:
+        """
+        Returns a unique id for the IF files of one run_engine call.
+
+        The service instances are shared between requests, so each run writes and
+        reads its own files instead of the fixed if_input0/if_output0 ones.
+        """
+        return uuid.uuid4().hex
+
+    def remove_if_files(self, file_id: int, run_id: str):
+        """
+        Removes the IF input and output files of a run once they are no longer needed.
+        """
+        suffix = _file_suffix(file_id, run_id)
+        for base_path in (self.INFILE_PATH, self.OUTFILE_PATH):
+            with suppress(FileNotFoundError):
+                os.remove(base_path + suffix + self.FILE_EXTENSION)
+
+    def run_if_chunk(
+        self, compute_resources: List[ComputeResource], file_id: int, run_id: str
+    ):
+        """
+        Runs IF on one chunk of resources and parses its output into them.
+
+        The IF files of the chunk are removed afterwards, even if the run failed.
+
+        Args:
+            compute_resources (List[ComputeResource]): The resources of the chunk.
+            file_id (int): Index of the chunk within the run.
+            run_id (str): Id of the run, see new_run_id.
+        """
+        try:
+            self.run_if(compute_resources, file_id, run_id=run_id)
+            self.parse_if_output(compute_resources, file_id=file_id, run_id=run_id)
+        finally:
+            self.remove_if_files(file_id, run_id)
+
     @staticmethod
     def get_models_info(data):
         """
@@ -265,6 +321,7 @@ class IFService(ABC, CarbonService):
         compute_resources: List[ComputeResource],
         emission_breakdown_at_pod_level: bool = False,
         file_id: int = 0,
+        run_id: str = "",
     ) -> List[ComputeResource] | Dict[str, Dict[str, Dict[str, List[Pod]]]]:
         """
         Parses the IF output file by removing the unnecessary information
@@ -272,7 +329,9 @@ class IFService(ABC, CarbonService):
         """
         start = time.time()
         logger.info("Parsing output for file %d...", file_id)
-        if_output = read_file(self.OUTFILE_PATH + str(file_id) + self.FILE_EXTENSION)
+        if_output = read_file(
+            self.OUTFILE_PATH + _file_suffix(file_id, run_id) + self.FILE_EXTENSION
+        )
         if if_output["execution"]["status"] != "success":
             err_text = (
                 f"IF has failed to calculate the carbon impact for file ID {file_id}."
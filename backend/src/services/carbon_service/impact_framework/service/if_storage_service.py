@@ -74,12 +74,12 @@ class IFStorageService(IFService):
             for x in range(0, len(storage_resources), chunk_size)
         ]
         lock = threading.Lock()
+        run_id = self.new_run_id()
 
         def compute_metrics_for_chunk(chunk, index):
             """Process a chunk of storage resources."""
-            self.run_if(chunk, index)  # Generate IF input file with file_id=index
-            # Parse IF output file with file_id=index
-            self.parse_if_output(chunk, file_id=index)
+            # Generate and parse the IF files with file_id=index
+            self.run_if_chunk(chunk, index, run_id)
 
             # Thread-safe update of original list
             with lock:
@@ -93,6 +93,15 @@ class IFStorageService(IFService):
             ]
             concurrent.futures.wait(futures)
 
+        self._log_carbon_summary(storage_resources)
+
+        return storage_resources
+
+    @staticmethod
+    def _log_carbon_summary(storage_resources: List[StorageResource]):
+        """
+        Logs the energy and carbon totals of the storage resources and the top emitters.
+        """
         total_energy = sum(
             storage.total_energy_consumed for storage in storage_resources
         )
@@ -129,8 +138,6 @@ class IFStorageService(IFService):
                 storage.replication_type,
             )
 
-        return storage_resources
-
     def get_models_info(self, data):
         """
         Load storage-specific models
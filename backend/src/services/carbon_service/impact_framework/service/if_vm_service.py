@@ -62,10 +62,10 @@ class IFVMService(IFService, ABC):
         chunk_size = min(chunk_size, len(vms))
         chunks = [vms[x : x + chunk_size] for x in range(0, len(vms), chunk_size)]
         lock = threading.Lock()
+        run_id = self.new_run_id()
 
         def compute_metrics_for_chunk(chunk, index):
-            self.run_if(chunk, file_id=index)
-            self.parse_if_output(chunk, file_id=index)
+            self.run_if_chunk(chunk, index, run_id)
             with lock:
                 for i, vm in enumerate(chunk):
                     vms[index * chunk_size + i] = vm
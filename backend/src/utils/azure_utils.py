@@ -4,6 +4,7 @@ Utility functions for Azure operations including authentication and blob storage
 
 import logging
 import os
+from functools import lru_cache
 from azure.core.exceptions import ClientAuthenticationError, HttpResponseError
 from azure.identity._credentials.client_secret import ClientSecretCredential
 from azure.storage.blob import BlobServiceClient, ContainerClient
@@ -13,6 +14,23 @@ from backend.src.common.known_exception import KnownException
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _client_secret_credential(
+    tenant_id: str, client_id: str, client_secret: str
+) -> ClientSecretCredential:
+    """
+    Get the credential for a service principal, building it only once.
+
+    The credential caches its access token, so sharing it lets the readers and
+    writers of a run reuse the same token.
+    """
+    return ClientSecretCredential(
+        tenant_id=tenant_id,
+        client_id=client_id,
+        client_secret=client_secret,
+    )
+
+
 def initialize_azure_client(config: "DaemonConfig") -> ClientSecretCredential:
     """
     Initialize Azure credentials.
@@ -22,10 +40,10 @@ def initialize_azure_client(config: "DaemonConfig") -> ClientSecretCredential:
     """
     try:
         # Config validation ensures these are not None, so we can safely access them
-        credential: ClientSecretCredential = ClientSecretCredential(
-            tenant_id=str(config.credentials.tenant_id),
-            client_id=str(config.credentials.client_id),
-            client_secret=str(config.credentials.client_secret),
+        credential: ClientSecretCredential = _client_secret_credential(
+            str(config.credentials.tenant_id),
+            str(config.credentials.client_id),
+            str(config.credentials.client_secret),
         )
         logger.debug("azure credentials initialized successfully")
         return credential
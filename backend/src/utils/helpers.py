@@ -12,6 +12,7 @@ import re
 from typing import Any
 from json.decoder import JSONDecodeError
 from datetime import datetime, timedelta
+import orjson
 import yaml
 from fastapi import Request
 from jinja2 import Template
@@ -31,7 +32,7 @@ logger = logging.getLogger(__name__)
 
 
 def validate_query_parameters(
-    request: Request, expected_params: set[str]
+    request: Request, expected_params: frozenset[str] | set[str]
 ) -> None:  # DO: apply RequestValidationError of FastAPI
     """
     Validate query parameters in the request against the expected parameters.
@@ -40,7 +41,7 @@ def validate_query_parameters(
     :param expected_params: The set of expected query parameters.
     :raises QueryParameterError: If unexpected query parameters are found.
     """
-    unexpected_params_set = set(request.query_params.keys()) - expected_params
+    unexpected_params_set = request.query_params.keys() - expected_params
     if unexpected_params_set:
         raise QueryParameterError(
             ErrorCode.VALIDATION_INVALID_QUERY_PARAMS,
@@ -62,7 +63,7 @@ def get_result_from_response(response: httpx.Response) -> list[dict[str, Any]]:
         DataFetchError: If there is an error in parsing the JSON or extracting the data.
     """
     try:
-        jsonified_response: dict[str, Any] = json.loads(response.content)
+        jsonified_response: dict[str, Any] = orjson.loads(response.content)
         return jsonified_response["data"]["result"]
     except KeyError as ex:
         logger.exception("Missing 'data' or 'result' in response")
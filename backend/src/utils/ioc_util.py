@@ -5,6 +5,8 @@ as well as a function for resolving concrete types based on abstract types and I
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 
 class IocRegistrationModel:
     """
@@ -26,12 +28,15 @@ class IocRegistrationModel:
         self.ioc_key = ioc_key
         self.abstract_type = abstract_type
         self.concrete_type = concrete_type
+        # instances are shared per duration, the services keep no per-request state
+        self.get_instance = lru_cache(maxsize=128)(concrete_type)
 
 
 def resolve(abstract_type: type, ioc_key: str, duration: int) -> object | None:
     """
     This function resolves the concrete type based on the provided abstract type and IoC key,
     used for carbon computation model selection (IF | CCF).
+    The same instance is returned for repeated calls with the same duration.
 
     Args:
         abstract_type (type): The abstract type to resolve.
@@ -44,7 +49,7 @@ def resolve(abstract_type: type, ioc_key: str, duration: int) -> object | None:
         if (ioc_registered_item.ioc_key == ioc_key) & (
             abstract_type_name == abstract_type.__name__
         ):
-            return ioc_registered_item.concrete_type(duration)
+            return ioc_registered_item.get_instance(duration)
     return None
 
 
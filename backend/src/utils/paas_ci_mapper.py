@@ -39,7 +39,9 @@ class PaasCiMapper:
         return None
 
     @staticmethod
-    @lru_cache(1000)  # we have 14 different azure regions
+    # Room for every known region, plus as many unknown ones falling back to the
+    # European average
+    @lru_cache(maxsize=2 * len(constants.REGION_CARBON_INTENSITY))
     def calculate_ci(zone: str) -> float:
         """backend_path = os.path.join(os.getcwd(), "..")
         caw_project_path = os.path.join(
@@ -62,13 +64,10 @@ class PaasCiMapper:
             ci_value = json_data[0]["Rating"]
             return ci_value
         return 0"""
-        if zone in constants.REGION_TO_COUNTRY_CARBON_INTENSITY:
-            return constants.REGION_TO_COUNTRY_CARBON_INTENSITY[zone][
-                "carbon_intensity"
-            ]
-        return (
-            constants.CARBON_INTENSITY_EUROPE
-        )  # fallback to default european average in case of a new region
+        # fallback to default european average in case of a new region
+        return constants.REGION_CARBON_INTENSITY.get(
+            zone, constants.CARBON_INTENSITY_EUROPE
+        )
 
     @staticmethod
     def get_ci_from_paas(paas: str) -> float:
@@ -54,3 +54,78 @@ async def test_run_engine_mismatched_array_lengths(mock_resolve, api_client):
 
     assert response.status_code == 400
     assert "CPU load and storage size arrays must have the same length" in response.text
+
+
+@pytest.mark.asyncio
+@patch("backend.src.api.endpoints.hw.ioc_util.resolve")
+async def test_run_engine_cpu_load_out_of_range(mock_resolve, api_client):
+    """
+    Test case for CPU load values outside of the 0-100 range.
+    """
+    params = {
+        "virtual_machine-type": "Standard_E16as_v4",
+        "cpu-load": [10, 120],
+        "storage-size": [100, 200],
+        "duration": 60,
+    }
+
+    response = api_client.get(
+        f"{settings.FASTAPI.API_STR}/hardware/run-engine-hardware/", params=params
+    )
+
+    assert response.status_code == 400
+    assert "CPU load values must be between 0 and 100" in response.text
+    mock_resolve.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("backend.src.api.endpoints.hw.ioc_util.resolve")
+async def test_run_engine_negative_storage_size(mock_resolve, api_client):
+    """
+    Test case for negative storage size values.
+    """
+    params = {
+        "virtual_machine-type": "Standard_E16as_v4",
+        "cpu-load": [10, 20],
+        "storage-size": [100, -1],
+        "duration": 60,
+    }
+
+    response = api_client.get(
+        f"{settings.FASTAPI.API_STR}/hardware/run-engine-hardware/", params=params
+    )
+
+    assert response.status_code == 400
+    assert "Storage size values must not be negative" in response.text
+    mock_resolve.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cpu_load, storage_size, message",
+    [
+        (["10", "nan"], ["100", "200"], "CPU load values must be between 0 and 100"),
+        (["10", "20"], ["100", "nan"], "Storage size values must not be negative"),
+    ],
+)
+@patch("backend.src.api.endpoints.hw.ioc_util.resolve")
+async def test_run_engine_nan_values(
+    mock_resolve, cpu_load, storage_size, message, api_client
+):
+    """
+    Test case for NaN CPU load and storage size values, which pass range comparisons.
+    """
+    params = {
+        "virtual_machine-type": "Standard_E16as_v4",
+        "cpu-load": cpu_load,
+        "storage-size": storage_size,
+        "duration": 60,
+    }
+
+    response = api_client.get(
+        f"{settings.FASTAPI.API_STR}/hardware/run-engine-hardware/", params=params
+    )
+
+    assert response.status_code == 400
+    assert message in response.text
+    mock_resolve.assert_not_called()
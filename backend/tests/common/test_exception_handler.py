@@ -0,0 +1,107 @@
+"""
+This module contains tests for the error code to HTTP status mapping.
+"""
+
+import unittest
+
+import orjson
+from fastapi import status
+
+from backend.src.common.errors import ErrorCode
+from backend.src.common.exception_handler import (
+    EncodedHTTPException,
+    get_status_code_for_error,
+    raise_http_error,
+)
+
+
+class TestGetStatusCodeForError(unittest.TestCase):
+    """
+    Test cases for the `get_status_code_for_error` function.
+    """
+
+    def test_configuration_error_maps_to_service_unavailable(self):
+        """Configuration errors are reported as 503."""
+        self.assertEqual(
+            get_status_code_for_error(ErrorCode.CONFIG_FILE_MISSING),
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+    def test_report_error_maps_to_internal_server_error(self):
+        """10xxx codes must not be mistaken for 1xxx configuration errors."""
+        self.assertEqual(
+            get_status_code_for_error(ErrorCode.REPORT_GENERATION_FAILED),
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    def test_every_code_maps_to_its_range_default(self):
+        """Every error code without a special case uses its range status."""
+        range_defaults = {
+            1: status.HTTP_503_SERVICE_UNAVAILABLE,
+            2: status.HTTP_401_UNAUTHORIZED,
+            3: status.HTTP_502_BAD_GATEWAY,
+            4: status.HTTP_422_UNPROCESSABLE_ENTITY,
+            5: status.HTTP_500_INTERNAL_SERVER_ERROR,
+            6: status.HTTP_500_INTERNAL_SERVER_ERROR,
+            7: status.HTTP_502_BAD_GATEWAY,
+            8: status.HTTP_503_SERVICE_UNAVAILABLE,
+            9: status.HTTP_502_BAD_GATEWAY,
+            10: status.HTTP_500_INTERNAL_SERVER_ERROR,
+        }
+        special_cases = {
+            ErrorCode.AUTH_UNAUTHORIZED: status.HTTP_403_FORBIDDEN,
+            ErrorCode.DATA_FETCH_TIMEOUT: status.HTTP_504_GATEWAY_TIMEOUT,
+            ErrorCode.THANOS_TIMEOUT: status.HTTP_504_GATEWAY_TIMEOUT,
+            ErrorCode.DATA_FETCH_NO_RESULTS: status.HTTP_404_NOT_FOUND,
+            ErrorCode.FILE_NOT_FOUND: status.HTTP_404_NOT_FOUND,
+            ErrorCode.DIRECTORY_NOT_FOUND: status.HTTP_404_NOT_FOUND,
+            ErrorCode.AZURE_STORAGE_BLOB_NOT_FOUND: status.HTTP_404_NOT_FOUND,
+            ErrorCode.AZURE_STORAGE_CONTAINER_NOT_FOUND: status.HTTP_404_NOT_FOUND,
+            ErrorCode.FILE_PERMISSION_DENIED: status.HTTP_403_FORBIDDEN,
+            ErrorCode.EXTERNAL_API_RATE_LIMIT: status.HTTP_429_TOO_MANY_REQUESTS,
+            ErrorCode.EXTERNAL_API_TIMEOUT: status.HTTP_504_GATEWAY_TIMEOUT,
+        }
+        for error_code in ErrorCode:
+            expected = special_cases.get(
+                error_code, range_defaults[int(error_code.value) // 1000]
+            )
+            with self.subTest(error_code=error_code):
+                self.assertEqual(get_status_code_for_error(error_code), expected)
+
+    def test_special_cases(self):
+        """Codes with a dedicated status override their range default."""
+        self.assertEqual(
+            get_status_code_for_error(ErrorCode.THANOS_TIMEOUT),
+            status.HTTP_504_GATEWAY_TIMEOUT,
+        )
+        self.assertEqual(
+            get_status_code_for_error(ErrorCode.AZURE_STORAGE_BLOB_NOT_FOUND),
+            status.HTTP_404_NOT_FOUND,
+        )
+        self.assertEqual(
+            get_status_code_for_error(ErrorCode.EXTERNAL_API_RATE_LIMIT),
+            status.HTTP_429_TOO_MANY_REQUESTS,
+        )
+
+
+class TestRaiseHttpError(unittest.TestCase):
+    """
+    Test cases for the `raise_http_error` function.
+    """
+
+    def test_raises_with_encoded_error_response(self):
+        """The standardized error response is encoded once when raising."""
+        with self.assertRaises(EncodedHTTPException) as context:
+            raise_http_error(400, "4001", "validation", "bad value", {"field": "x"})
+
+        expected = {
+            "error": {
+                "code": "4001",
+                "category": "validation",
+                "message": "bad value",
+                "details": {"field": "x"},
+            }
+        }
+        self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual(context.exception.detail, expected)
+        self.assertEqual(orjson.loads(context.exception.encoded_body), expected)
@@ -5,7 +5,12 @@ Module containing unit tests for the settings configuration of the Carbon Engine
 import logging
 from unittest.mock import MagicMock, patch
 import pytest
-from backend.src.core.settings import configure_logger, get_settings, Settings
+from backend.src.core.settings import (
+    configure_logger,
+    get_settings,
+    use_colors,
+    Settings,
+)
 from backend.src.common.enums import LogLevel
 from backend.src.common.known_exception import ConfigValidationError
 
@@ -23,6 +28,25 @@ def test_configure_logger() -> None:
     assert logging.getLogger().getEffectiveLevel() == logging.WARNING
 
 
+@pytest.mark.parametrize(
+    "isatty, no_color, expected",
+    [(True, None, True), (True, "1", False), (False, None, False)],
+)
+def test_use_colors(
+    monkeypatch: pytest.MonkeyPatch, isatty: bool, no_color: str | None, expected: bool
+) -> None:
+    """
+    Test that console colors are only used on a terminal without NO_COLOR set.
+    """
+    if no_color is None:
+        monkeypatch.delenv("NO_COLOR", raising=False)
+    else:
+        monkeypatch.setenv("NO_COLOR", no_color)
+    handler = MagicMock()
+    handler.stream.isatty.return_value = isatty
+    assert use_colors(handler) is expected
+
+
 @pytest.fixture(autouse=True)
 def clear_settings_cache() -> None:
     """
@@ -22,10 +22,13 @@ from backend.src.services.carbon_service.impact_framework.service.if_storage_ser
 )
 
 
+@patch("backend.src.core.registrar.get_config")
 @patch("backend.src.core.registrar.FastAPI")
 @patch("backend.src.core.registrar.register_router")
 @patch("backend.src.core.registrar.register_models")
-def test_register_app(mock_register_models, mock_register_router, mock_fastapi):
+def test_register_app(
+    mock_register_models, mock_register_router, mock_fastapi, mock_get_config
+):
     """
     Test registering FastAPI application.
     """
@@ -47,6 +50,7 @@ def test_register_app(mock_register_models, mock_register_router, mock_fastapi):
         openapi_url="/test/openapi",
     )
     mock_register_models.assert_called_once()
+    mock_get_config.assert_called_once_with()
 
 
 @patch("backend.src.core.registrar.api_router")
@@ -0,0 +1,60 @@
+"""
+This module contains tests for the AAD authentication strategy.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.src.crud.auth_strategies.aad_auth import AAD, _msal_app
+
+
+@pytest.fixture(autouse=True)
+def clear_msal_app_cache():
+    """Keep the patched MSAL applications from leaking between tests."""
+    _msal_app.cache_clear()
+    yield
+    _msal_app.cache_clear()
+
+
+@patch("backend.src.crud.auth_strategies.aad_auth.ConfidentialClientApplication")
+def test_get_headers_reuses_token_until_expiry(mock_msal_app: MagicMock) -> None:
+    """The token is only acquired once while it is still valid."""
+    mock_msal_app.return_value.acquire_token_for_client.return_value = {
+        "access_token": "token",
+        "expires_in": 3599,
+    }
+    aad = AAD(MagicMock())
+
+    first = aad.get_headers()
+    second = aad.get_headers()
+
+    assert first == second == {"Authorization": "Bearer token"}
+    mock_msal_app.return_value.acquire_token_for_client.assert_called_once()
+
+
+@patch("backend.src.crud.auth_strategies.aad_auth.ConfidentialClientApplication")
+def test_get_headers_reacquires_after_invalidate(mock_msal_app: MagicMock) -> None:
+    """Invalidating the strategy forces a new token acquisition."""
+    mock_msal_app.return_value.acquire_token_for_client.side_effect = [
+        {"access_token": "old", "expires_in": 3599},
+        {"access_token": "new", "expires_in": 3599},
+    ]
+    aad = AAD(MagicMock())
+
+    aad.get_headers()
+    aad.invalidate()
+
+    assert aad.get_headers() == {"Authorization": "Bearer new"}
+
+
+@patch("backend.src.crud.auth_strategies.aad_auth.ConfidentialClientApplication")
+def test_msal_app_is_shared_between_instances(mock_msal_app: MagicMock) -> None:
+    """Strategies built from the same credentials reuse one MSAL application."""
+    config = MagicMock()
+
+    first = AAD(config)
+    second = AAD(config)
+
+    assert first.app is second.app
+    mock_msal_app.assert_called_once()
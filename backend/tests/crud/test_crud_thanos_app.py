@@ -146,6 +146,35 @@ async def test_exec_query_with_time_range(
     assert params["step"] == "60s"
 
 
+@pytest.mark.asyncio
+@patch("backend.src.crud.crud_thanos_app.httpx.AsyncClient")
+@patch("backend.src.crud.crud_thanos_app.get_result_from_response")
+async def test_exec_query_without_sampling_rate(
+    mock_get_result: MagicMock, mock_client: MagicMock, crud_app: CrudThanosApp
+) -> None:
+    """Test that no step is sent when no sampling rate is given"""
+    mock_response = MagicMock()
+    mock_response.headers = {"Content-Type": "application/json"}
+    mock_response.content = b'{"data": "ok"}'
+
+    mock_client_instance = AsyncMock()
+    mock_client_instance.__aenter__.return_value = mock_client_instance
+    mock_client_instance.__aexit__.return_value = None
+    mock_client_instance.get = AsyncMock(return_value=mock_response)
+    mock_client.return_value = mock_client_instance
+
+    mock_get_result.return_value = {"data": "ok"}
+
+    start = datetime(2024, 1, 1, 0, 0, 0)
+    end = datetime(2024, 1, 1, 1, 0, 0)
+
+    await crud_app.exec_query("up", start=start, end=end)
+
+    params = mock_client_instance.get.call_args[1]["params"]
+    assert "start" in params
+    assert "step" not in params
+
+
 @pytest.mark.asyncio
 @patch("backend.src.crud.crud_thanos_app.httpx.AsyncClient")
 async def test_exec_query_timeout_error(
@@ -208,3 +237,46 @@ async def test_exec_query_token_refresh_failure(
 
     assert exc_info.value.error_code.value == "2005"  # AUTH_TOKEN_REFRESH_FAILED
     assert "refresh" in exc_info.value.formatted_string.lower()
+
+
+@pytest.mark.asyncio
+@patch("backend.src.crud.crud_thanos_app.httpx.AsyncClient")
+@patch("backend.src.crud.crud_thanos_app.get_result_from_response")
+async def test_exec_query_reuses_http_client(
+    mock_get_result: MagicMock, mock_client: MagicMock, crud_app: CrudThanosApp
+) -> None:
+    """Test that consecutive queries share one HTTP client until it is closed"""
+    mock_response = MagicMock()
+    mock_response.headers = {"Content-Type": "application/json"}
+
+    mock_client_instance = AsyncMock()
+    mock_client_instance.get = AsyncMock(return_value=mock_response)
+    mock_client.return_value = mock_client_instance
+    mock_get_result.return_value = {"data": "result"}
+
+    await crud_app.exec_query("up")
+    await crud_app.exec_query("up")
+
+    mock_client.assert_called_once()
+    assert mock_client_instance.get.call_count == 2
+
+    await crud_app.aclose()
+
+    mock_client_instance.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_exec_queries_returns_results_in_query_order(
+    crud_app: CrudThanosApp,
+) -> None:
+    """Test that concurrent queries return their results in the queries order"""
+    start = datetime(2024, 1, 1, 0, 0, 0)
+    end = datetime(2024, 1, 1, 1, 0, 0)
+
+    with patch.object(
+        crud_app, "exec_query", AsyncMock(side_effect=lambda query, *_: [query])
+    ) as mock_exec_query:
+        result = await crud_app.exec_queries(["q1", "q2", "q3"], start, end, "60s")
+
+    assert result == [["q1"], ["q2"], ["q3"]]
+    assert mock_exec_query.await_count == 3
@@ -290,14 +290,14 @@ class TestMainFunction(unittest.TestCase):
     Unit test class for the main function in the carbon_daemon module.
     """
 
-    @patch("backend.src.daemon.carbon_daemon.config")
+    @patch("backend.src.daemon.carbon_daemon.get_config")
     @patch("backend.src.daemon.carbon_daemon.CarbonDaemon")
-    def test_main_success(self, mock_carbon_daemon_class, mock_config):
+    def test_main_success(self, mock_carbon_daemon_class, mock_get_config):
         """
         Test successful execution of main function.
         """
         mock_daemon_config = MagicMock()
-        mock_config.carmen_daemon = mock_daemon_config
+        mock_get_config.return_value.carmen_daemon = mock_daemon_config
 
         mock_daemon_instance = MagicMock()
         mock_result = CarbonDaemonResult(success=True, vm_count=5, execution_time=10.5)
@@ -312,14 +312,14 @@ class TestMainFunction(unittest.TestCase):
 
         self.assertIn("daemon execution completed successfully", log.output[-1])
 
-    @patch("backend.src.daemon.carbon_daemon.config")
+    @patch("backend.src.daemon.carbon_daemon.get_config")
     @patch("backend.src.daemon.carbon_daemon.CarbonDaemon")
-    def test_main_daemon_failure(self, mock_carbon_daemon_class, mock_config):
+    def test_main_daemon_failure(self, mock_carbon_daemon_class, mock_get_config):
         """
         Test main function when daemon execution fails.
         """
         mock_daemon_config = MagicMock()
-        mock_config.carmen_daemon = mock_daemon_config
+        mock_get_config.return_value.carmen_daemon = mock_daemon_config
 
         mock_daemon_instance = MagicMock()
         mock_result = CarbonDaemonResult(
@@ -336,14 +336,14 @@ class TestMainFunction(unittest.TestCase):
 
         self.assertIn("daemon execution failed: Test failure", log.output[-1])
 
-    @patch("backend.src.daemon.carbon_daemon.config")
+    @patch("backend.src.daemon.carbon_daemon.get_config")
     @patch("backend.src.daemon.carbon_daemon.CarbonDaemon")
-    def test_main_critical_exception(self, mock_carbon_daemon_class, mock_config):
+    def test_main_critical_exception(self, mock_carbon_daemon_class, mock_get_config):
         """
         Test main function when a critical exception occurs during daemon creation.
         """
         mock_daemon_config = MagicMock()
-        mock_config.carmen_daemon = mock_daemon_config
+        mock_get_config.return_value.carmen_daemon = mock_daemon_config
 
         mock_carbon_daemon_class.side_effect = Exception("Critical error")
 
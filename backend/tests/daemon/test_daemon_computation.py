@@ -280,9 +280,9 @@ def test_carbon_daemon_with_sample_data(
             ), f"Energy {first_vm.total_energy_consumed} vs expected {expected_energy} differs too much"
 
 
-@patch("backend.src.daemon.carbon_daemon.config")
+@patch("backend.src.daemon.carbon_daemon.get_config")
 def test_daemon_with_mocked_components(
-    mock_config: MagicMock,
+    mock_get_config: MagicMock,
     setup_report_dir: None,
     mock_daemon_config: MagicMock,
 ):
@@ -290,7 +290,7 @@ def test_daemon_with_mocked_components(
     Test the daemon with fully mocked reader, writer, and carbon service.
     This test focuses on the integration and data flow rather than actual calculations.
     """
-    mock_config.carmen_daemon = mock_daemon_config
+    mock_get_config.return_value.carmen_daemon = mock_daemon_config
 
     test_vms = [
         VirtualMachine(
@@ -365,9 +365,9 @@ def test_daemon_with_mocked_components(
         mock_writer.upload_compute_report.assert_called_once()
 
 
-@patch("backend.src.daemon.carbon_daemon.config")
+@patch("backend.src.daemon.carbon_daemon.get_config")
 def test_daemon_computation_integration(
-    mock_config: MagicMock,
+    mock_get_config: MagicMock,
     setup_report_dir: None,
     vm1: dict[str, str | float | int],
     mock_daemon_config: MagicMock,
@@ -376,7 +376,7 @@ def test_daemon_computation_integration(
     Integration test that uses real carbon calculations with mocked I/O.
     This test validates that the carbon computation pipeline works correctly with actual IF calculations.
     """
-    mock_config.carmen_daemon = mock_daemon_config
+    mock_get_config.return_value.carmen_daemon = mock_daemon_config
 
     from backend.src.utils.paas_ci_mapper import PaasCiMapper
 
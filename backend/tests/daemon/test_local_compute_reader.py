@@ -0,0 +1,80 @@
+"""
+Unit tests for the local compute reader strategy.
+"""
+
+from unittest.mock import MagicMock
+
+from backend.src.daemon.readers.compute.local_compute_reader import (
+    LocalComputeReaderStrategy,
+)
+
+HEADER = (
+    "Time,Id,AverageCpuPercentage,Region,Subscription,Name,Size,DiskSizeGb,"
+    "Service,Instance,Component,Environment,Partition\n"
+)
+
+
+def _row(vm_id: str, time: str, cpu: str) -> str:
+    return f"{time},{vm_id},{cpu},eastus,sub,{vm_id},Standard_D2_v2,128,-,-,-,prd,-\n"
+
+
+def _reader(tmp_path, file_names: list[str]) -> LocalComputeReaderStrategy:
+    config = MagicMock()
+    config.source.local.source_path = str(tmp_path)
+    config.source.file_names = file_names
+    return LocalComputeReaderStrategy(config)
+
+
+def test_read_files_merges_series_across_files(tmp_path):
+    """Rows of the same VM in successive files are appended in file order."""
+    (tmp_path / "hour_0.csv").write_text(HEADER + _row("vm1", "00:10:00", "10"))
+    (tmp_path / "hour_1.csv").write_text(HEADER + _row("vm1", "01:10:00", "30"))
+
+    vms = _reader(tmp_path, ["hour_0.csv", "hour_1.csv"]).read_files()
+
+    assert len(vms) == 1
+    assert vms[0].time_points == ["00:10:00", "01:10:00"]
+    assert vms[0].cpu_util == [0.1, 0.3]
+
+
+def test_read_files_rejects_undecodable_file_as_a_whole(tmp_path):
+    """A decode error in a file drops all its rows, not only the ones after it."""
+    (tmp_path / "hour_0.csv").write_text(HEADER + _row("vm1", "00:10:00", "10"))
+    # Large enough for the invalid byte to be decoded after the first rows
+    rows = "".join(_row(f"vm{index}", "01:10:00", "30") for index in range(1, 1000))
+    (tmp_path / "hour_1.csv").write_bytes((HEADER + rows).encode() + b"\xff\xfe\n")
+
+    vms = _reader(tmp_path, ["hour_0.csv", "hour_1.csv"]).read_files()
+
+    assert [vm.id for vm in vms] == ["vm1"]
+    assert vms[0].time_points == ["00:10:00"]
+
+
+def test_read_files_skips_truncated_rows(tmp_path):
+    """Rows with fewer fields than the header are skipped, not indexed."""
+    (tmp_path / "hour_0.csv").write_text(
+        HEADER + "00:10:00,vm2,20\n" + _row("vm1", "00:10:00", "10")
+    )
+
+    vms = _reader(tmp_path, ["hour_0.csv"]).read_files()
+
+    assert [vm.id for vm in vms] == ["vm1"]
+    assert vms[0].cpu_util == [0.1]
+
+
+def test_read_files_rolls_back_file_failing_part_way(tmp_path):
+    """A file failing on a bad value leaves the series as they were before it."""
+    (tmp_path / "hour_0.csv").write_text(HEADER + _row("vm1", "00:10:00", "10"))
+    (tmp_path / "hour_1.csv").write_text(
+        HEADER
+        + _row("vm1", "01:10:00", "30")
+        + _row("vm2", "01:10:00", "50")
+        + _row("vm3", "01:10:00", "not-a-number")
+    )
+
+    vms = _reader(tmp_path, ["hour_0.csv", "hour_1.csv"]).read_files()
+
+    assert [vm.id for vm in vms] == ["vm1"]
+    assert vms[0].time_points == ["00:10:00"]
+    assert vms[0].cpu_util == [0.1]
+    assert vms[0].storage_size == [128.0]
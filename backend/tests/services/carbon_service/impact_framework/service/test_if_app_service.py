@@ -2,7 +2,7 @@
 """
 Unit tests for the IFAppService class in the carbon service impact framework.
 """
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import ANY, patch, MagicMock, AsyncMock
 import pytest
 from backend.src.schemas.application import Application
 from backend.src.schemas.pod import Pod
@@ -76,8 +76,8 @@ async def test_run_engine(
 
     assert isinstance(result, list)
     assert isinstance(result[0], Application)
-    mock_run_if.assert_called_once_with([mock_application])
-    mock_parse_if_output.assert_called_once_with([mock_application], False)
+    mock_run_if.assert_called_once_with([mock_application], run_id=ANY)
+    mock_parse_if_output.assert_called_once_with([mock_application], False, run_id=ANY)
 
 
 @pytest.mark.asyncio
@@ -104,8 +104,8 @@ async def test_run_engine_at_pod_level(
     )
 
     assert isinstance(result, dict)
-    mock_run_if.assert_called_once_with([mock_application])
-    mock_parse_if_output.assert_called_once_with([mock_application], True)
+    mock_run_if.assert_called_once_with([mock_application], run_id=ANY)
+    mock_parse_if_output.assert_called_once_with([mock_application], True, run_id=ANY)
 
 
 def test_get_resource_data(app_service, mock_application, mock_pod_fixture):
@@ -3,7 +3,7 @@
 Unit tests for the IF_Service in impact framework.
 """
 import unittest
-from unittest.mock import patch, mock_open as open_mock, MagicMock
+from unittest.mock import call, patch, mock_open as open_mock, MagicMock
 from itertools import cycle
 import yaml
 from jinja2 import Template, exceptions
@@ -182,6 +182,67 @@ class TestIFService(unittest.TestCase):
         )
         self.assertIsNone(result)
 
+    @patch("os.system")
+    @patch.object(IFService, "__init__", lambda self, *args, **kwargs: None)
+    def test_run_command_in_shell_with_run_id(self, mock_os_system):
+        """
+        Test that the files of a run are suffixed by its run id, so that concurrent
+        runs do not share them.
+        """
+        mock_service = MagicMock(spec=IFService)
+        mock_service.INFILE_PATH = "mock_infile_path"
+        mock_service.OUTFILE_PATH = "mock_outfile_path"
+        mock_service.FILE_EXTENSION = ".yaml"
+        mock_os_system.return_value = 0
+
+        IFService.run_command_in_shell(mock_service, 2, "run")
+
+        mock_os_system.assert_called_once_with(
+            'npx if-run --manifest "mock_infile_path_run_2.yaml" '
+            '--output "mock_outfile_path_run_2.yaml"'
+        )
+
+    def test_new_run_id_is_unique(self):
+        """
+        Test that every run gets its own run id.
+        """
+        self.assertNotEqual(IFService.new_run_id(), IFService.new_run_id())
+
+    @patch("os.remove")
+    @patch.object(IFService, "__init__", lambda self, *args, **kwargs: None)
+    def test_remove_if_files(self, mock_remove):
+        """
+        Test that remove_if_files deletes the input and output files of a run and
+        ignores the ones that were never written.
+        """
+        mock_service = MagicMock(spec=IFService)
+        mock_service.INFILE_PATH = "mock_infile_path"
+        mock_service.OUTFILE_PATH = "mock_outfile_path"
+        mock_service.FILE_EXTENSION = ".yaml"
+        mock_remove.side_effect = [None, FileNotFoundError()]
+
+        IFService.remove_if_files(mock_service, 0, "run")
+
+        mock_remove.assert_has_calls(
+            [
+                call("mock_infile_path_run_0.yaml"),
+                call("mock_outfile_path_run_0.yaml"),
+            ]
+        )
+
+    def test_run_if_chunk_removes_files_on_failure(self):
+        """
+        Test that run_if_chunk removes the chunk files even when IF fails.
+        """
+        mock_service = MagicMock(spec=IFService)
+        mock_service.run_if.side_effect = ValueError("IF failed")
+
+        with self.assertRaises(ValueError):
+            IFService.run_if_chunk(mock_service, [], 1, "run")
+
+        mock_service.parse_if_output.assert_not_called()
+        mock_service.remove_if_files.assert_called_once_with(1, "run")
+
     @patch("os.system")
     @patch(
         "backend.src.services.carbon_service.impact_framework.service.if_service.logger.error"
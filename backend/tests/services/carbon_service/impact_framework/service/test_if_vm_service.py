@@ -2,7 +2,7 @@
 """
 Unit tests for IF_VM_service in impact framework.
 """
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, patch, MagicMock
 import pytest
 from robot.utils.asserts import assert_true
 
@@ -41,8 +41,10 @@ def test_run_engine_success(mock_parse_if_output, mock_run_if, mock_vm_1):
 
     result = service.run_engine([mock_vm_1])
 
-    mock_run_if.assert_called_once_with(service, [mock_vm_1], 0)
-    mock_parse_if_output.assert_called_once_with(service, [mock_vm_1], file_id=0)
+    mock_run_if.assert_called_once_with(service, [mock_vm_1], 0, run_id=ANY)
+    mock_parse_if_output.assert_called_once_with(
+        service, [mock_vm_1], file_id=0, run_id=ANY
+    )
     assert result == [mock_vm_1]
 
 
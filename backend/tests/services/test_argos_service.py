@@ -33,7 +33,7 @@ NAMESPACES_RESPONSE = [
 
 
 @pytest.mark.asyncio
-@patch("backend.src.services.argos_service.AppDao.exec_query")
+@patch("backend.src.crud.crud_thanos_app.CrudThanosApp.exec_query")
 @patch("backend.src.services.argos_service.return_desired_metric_from_response")
 async def test_get_available_resources_no_args(
     mock_return_desired_metric, mock_exec_query
@@ -56,7 +56,7 @@ async def test_get_available_resources_no_args(
 
 
 @pytest.mark.asyncio
-@patch("backend.src.services.argos_service.AppDao.exec_query")
+@patch("backend.src.crud.crud_thanos_app.CrudThanosApp.exec_query")
 @patch("backend.src.services.argos_service.return_desired_metric_from_response")
 async def test_get_available_resources_with_apps_and_clusters(
     mock_return_desired_metric, mock_exec_query
@@ -76,7 +76,7 @@ async def test_get_available_resources_with_apps_and_clusters(
 
 
 @pytest.mark.asyncio
-@patch("backend.src.services.argos_service.AppDao.exec_query")
+@patch("backend.src.crud.crud_thanos_app.CrudThanosApp.exec_query")
 @patch("backend.src.services.argos_service.return_desired_metric_from_response")
 async def test_get_available_resources_with_apps_only(
     mock_return_desired_metric, mock_exec_query
@@ -101,7 +101,7 @@ async def test_get_available_resources_with_apps_only(
 
 
 @pytest.mark.asyncio
-@patch("backend.src.services.argos_service.AppDao.exec_query")
+@patch("backend.src.crud.crud_thanos_app.CrudThanosApp.exec_query")
 @patch("backend.src.services.argos_service.return_desired_metric_from_response")
 async def test_get_available_resources_with_clusters_only(
     mock_return_desired_metric, mock_exec_query
@@ -121,7 +121,10 @@ async def test_get_available_resources_with_clusters_only(
 
 
 @pytest.mark.asyncio
-@patch("backend.src.services.argos_service.AppDao.exec_query", new_callable=AsyncMock)
+@patch(
+    "backend.src.crud.crud_thanos_app.CrudThanosApp.exec_query",
+    new_callable=AsyncMock,
+)
 @patch(
     "backend.src.services.argos_service.ArgosService.parse_pod_data",
     new_callable=AsyncMock,
@@ -176,7 +179,10 @@ async def test_retrieve_telemetry_data_success(mock_parse_pod_data, mock_exec_qu
 
 
 @pytest.mark.asyncio
-@patch("backend.src.services.argos_service.AppDao.exec_query", new_callable=AsyncMock)
+@patch(
+    "backend.src.crud.crud_thanos_app.CrudThanosApp.exec_query",
+    new_callable=AsyncMock,
+)
 @patch(
     "backend.src.services.argos_service.ArgosService.parse_pod_data",
     new_callable=AsyncMock,
@@ -215,7 +221,10 @@ async def test_retrieve_telemetry_data_no_pods_found(
 
 
 @pytest.mark.asyncio
-@patch("backend.src.services.argos_service.AppDao.exec_query", new_callable=AsyncMock)
+@patch(
+    "backend.src.crud.crud_thanos_app.CrudThanosApp.exec_query",
+    new_callable=AsyncMock,
+)
 @patch(
     "backend.src.services.argos_service.ArgosService.parse_pod_data",
     new_callable=AsyncMock,
@@ -318,6 +327,25 @@ def test_interpolate_field_data():
     assert result == expected
 
 
+def test_interpolate_field_data_with_epoch_seconds():
+    """
+    Test the interpolation with desired timestamps already converted to epoch seconds.
+    """
+    desired_ts = [
+        datetime.strptime("2023-01-01 00:00:00", "%Y-%m-%d %H:%M:%S"),
+        datetime.strptime("2023-01-01 01:00:00", "%Y-%m-%d %H:%M:%S"),
+        datetime.strptime("2023-01-01 02:00:00", "%Y-%m-%d %H:%M:%S"),
+    ]
+    desired_epochs = ArgosService.to_epoch_seconds(desired_ts)
+    pod_ts = desired_epochs[[0, 2]]
+    values = np.array([1.0, 3.0])
+
+    result = ArgosService.interpolate_field_data(desired_epochs, pod_ts, values)
+
+    assert result == [1.0, 2.0, 3.0]
+    assert result == ArgosService.interpolate_field_data(desired_ts, pod_ts, values)
+
+
 def test_create_resource_application(sample_pods):
     """
     Test the creation of an Application object.
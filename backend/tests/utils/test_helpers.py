@@ -75,24 +75,24 @@ class TestHelpers(unittest.TestCase):
         labels = get_result_from_response(response)
         self.assertEqual(labels, ["label1", "label2"])
 
-    @patch("json.loads")
+    @patch("orjson.loads")
     def test_get_result_from_response_key_error(self, mock_json_loads):
         """
         Test case for key error while getting to result from response
         """
-        # Mock json.loads to return a dictionary without the "data" key
+        # Mock orjson.loads to return a dictionary without the "data" key
         mock_json_loads.return_value = {"error": "missing data"}
 
         # Call the function and expect it to raise a DataFetchError
         with self.assertRaises(DataFetchError):
             get_result_from_response(MagicMock())
 
-    @patch("json.loads")
+    @patch("orjson.loads")
     def test_get_result_from_response_json_decode_error(self, mock_json_loads):
         """
         Test case for json decode error while getting to result from response
         """
-        # Mock json.loads to raise a JSONDecodeError
+        # Mock orjson.loads to raise a JSONDecodeError
         mock_json_loads.side_effect = JSONDecodeError(msg="invalid JSON", doc="", pos=0)
 
         # Call the function and expect it to raise a DataFetchError
@@ -45,6 +45,24 @@ class TestIocUtil(unittest.TestCase):
             resolved = resolve(int, "key", 60)
             self.assertEqual(resolved, "60")
 
+    def test_resolve_reuses_instance_for_same_duration(self):
+        """
+        Test case for resolving twice with the same and a different duration.
+        """
+
+        class Service:  # pylint: disable=too-few-public-methods
+            """Concrete type storing the duration it was built with."""
+
+            def __init__(self, duration):
+                self.duration = duration
+
+        with self._set_up_mocked_registration_models(
+            [IocRegistrationModel("key", int, Service)]
+        ):
+            first = resolve(int, "key", 60)
+            self.assertIs(resolve(int, "key", 60), first)
+            self.assertEqual(resolve(int, "key", 30).duration, 30)
+
     def test_resolve_with_non_matching_abstract_type(self):
         """
         Test case for resolving with non-matching abstract type.
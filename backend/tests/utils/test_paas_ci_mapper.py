@@ -60,6 +60,13 @@ class TestPaasCiMapper(unittest.TestCase):
         result = PaasCiMapper.calculate_ci(mock_zone)
         assert result == 281
 
+    def test_calculate_ci_with_francesouth(self):
+        """
+        Tests the calculate_ci method with the francesouth zone.
+        """
+        result = PaasCiMapper.calculate_ci("francesouth")
+        assert result == 44
+
     @patch.object(
         PaasCiMapper,
         "_PaasCiMapper__extract_zone_from_paas",